@@ -0,0 +1,33 @@
+import timeit
+import tracemalloc
+
+from arena import ArenaDocument
+from bench_render import make_document
+
+
+# the arena points at the same value strings as the tree it was built from,
+# so its size is what it costs on top of them
+def traced_size(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, after - before
+
+
+def main():
+    tree, tree_bytes = traced_size(make_document)
+    arena, arena_bytes = traced_size(lambda: ArenaDocument.from_node(tree))
+    assert arena.to_html() == tree.to_html()
+
+    print(f"nodes: {len(arena)}, distinct strings: {len(arena.strings)}")
+    print("MB: the tree with its value strings, the arena without them")
+    print(f"{'':>6} {'MB':>8} {'render ms':>10}")
+    for name, document, size in (("tree", tree, tree_bytes), ("arena", arena, arena_bytes)):
+        seconds = min(timeit.repeat(document.to_html, number=2, repeat=25)) / 2
+        print(f"{name:>6} {size / 1e6:8.2f} {seconds * 1000:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import timeit
+
+from inline_parser import parse_inline
+from markdown_to_textnode import text_to_textnodes_batch
+
+
+# short list items, the case the batch API was asked for
+ITEMS = [f"item {i} with **bold** and a [link](/page/{i})" if i % 3 else f"plain item {i}" for i in range(20000)]
+
+
+def plain_loop(items):
+    return [parse_inline(text) for text in items]
+
+
+def batch(items):
+    return list(text_to_textnodes_batch(items))
+
+
+def main():
+    assert batch(ITEMS) == plain_loop(ITEMS)
+
+    for name, func in (("plain loop", lambda: plain_loop(ITEMS)), ("batch", lambda: batch(ITEMS))):
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:>10}: {seconds * 1e3:8.2f} ms for {len(ITEMS)} items")
+
+
+if __name__ == "__main__":
+    main()
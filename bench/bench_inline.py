@@ -0,0 +1,43 @@
+import timeit
+
+from markdown_to_textnode import text_to_textnodes_multipass
+from inline_parser import parse_inline
+
+
+SPANS = [
+    "**bold words**",
+    "_italic words_",
+    "`inline code`",
+    "[a link](https://example.com/docs/page)",
+    "![an image](https://example.com/img.png)",
+]
+
+
+def make_paragraph(span_count):
+    parts = ["Plain lead-in text for the paragraph."]
+    for i in range(span_count):
+        parts.append(SPANS[i % len(SPANS)])
+        parts.append("and some filler text in between")
+
+    return " ".join(parts)
+
+
+def bench(func, text):
+    number = max(1, 20000 // (len(text) // 40 + 1))
+    seconds = min(timeit.repeat(lambda: func(text), number=number, repeat=5))
+    return seconds / number * 1e6
+
+
+def main():
+    print(f"{'spans':>6} {'multipass us':>14} {'single-pass us':>16} {'speedup':>8}")
+    for span_count in (0, 10, 1000):
+        text = make_paragraph(span_count)
+        assert parse_inline(text) == text_to_textnodes_multipass(text)
+
+        old = bench(text_to_textnodes_multipass, text)
+        new = bench(parse_inline, text)
+        print(f"{span_count:>6} {old:>14.2f} {new:>16.2f} {old / new:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
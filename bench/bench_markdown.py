@@ -0,0 +1,45 @@
+import timeit
+
+from block_to_html import markdown_to_html_node
+
+
+def make_doc_page(i, sections=20):
+    # a docs page: headings, prose with inline markup, lists, a quote and
+    # code samples in the proportions of a typical reference page
+    parts = [f"# Module {i}", f"The `module_{i}` package provides **fast** helpers for _everyday_ tasks."]
+    for j in range(sections):
+        parts.extend(
+            [
+                f"## Section {j}",
+                f"Call `run_{j}()` to start a job. It returns a **handle** that can be\n"
+                f"awaited, cancelled or passed to [the scheduler](/docs/scheduler/{j}).\n"
+                f"Handles are _cheap_ to create & safe to share between threads.",
+                f"- first option for `run_{j}`\n- second option with **emphasis**\n- see [notes](/notes/{j})",
+                f"```\nhandle = run_{j}(items, workers=4)\nresult = handle.wait()\nprint(result)\n```",
+                f"> Note: `run_{j}` raises *ValueError* when items is empty.",
+                f"1. create the job\n2. wait for it\n3. read the **result**",
+            ]
+        )
+    return "\n\n".join(parts) + "\n"
+
+
+def main():
+    corpus = [make_doc_page(i) for i in range(50)]
+    size = sum(len(page.encode()) for page in corpus)
+
+    def convert():
+        for page in corpus:
+            markdown_to_html_node(page)
+
+    def convert_and_render():
+        for page in corpus:
+            markdown_to_html_node(page).to_html()
+
+    print(f"corpus: {len(corpus)} pages, {size / 1e6:.2f} MB")
+    for name, func in (("to nodes", convert), ("to html", convert_and_render)):
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:>9}: {size / 1e6 / seconds:6.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
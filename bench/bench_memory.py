@@ -0,0 +1,66 @@
+import tracemalloc
+
+from leafnode import LeafNode
+from parentnode import ParentNode
+from textnode import TextNode, TextType
+
+
+# subclasses without __slots__ get a per-instance __dict__ again, which is
+# what every node carried before the classes were slotted
+class DictTextNode(TextNode):
+    pass
+
+
+class DictLeafNode(LeafNode):
+    pass
+
+
+class DictParentNode(ParentNode):
+    pass
+
+
+COUNT = 100000
+
+
+def bytes_per_node(make):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [make(i) for i in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del nodes
+    # the list holding the nodes is the same for both variants
+    return (after - before - 8 * COUNT) / COUNT
+
+
+def main():
+    shared_text = "shared text"
+    shared_children = [LeafNode("b", "x")]
+    cases = [
+        (
+            "TextNode",
+            lambda i: DictTextNode(shared_text, TextType.BOLD),
+            lambda i: TextNode(shared_text, TextType.BOLD),
+        ),
+        (
+            "LeafNode",
+            lambda i: DictLeafNode("p", shared_text),
+            lambda i: LeafNode("p", shared_text),
+        ),
+        (
+            "ParentNode",
+            lambda i: DictParentNode("div", shared_children),
+            lambda i: ParentNode("div", shared_children),
+        ),
+    ]
+
+    print(f"{'class':>10} {'dict B/node':>12} {'slots B/node':>13}")
+    for name, with_dict, with_slots in cases:
+        before = bytes_per_node(with_dict)
+        after = bytes_per_node(with_slots)
+        print(f"{name:>10} {before:>12.1f} {after:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+def indent(depth):
+    return LeafNode(None, "\n" + "  " * depth)
+
+
+def make_reference_page(entries):
+    # a generated reference page: indented markup, wrapped descriptions and
+    # a code sample per entry
+    sections = []
+    for i in range(entries):
+        sections.extend(
+            [
+                indent(2),
+                ParentNode(
+                    "section",
+                    [
+                        indent(3),
+                        LeafNode("h2", f"function_{i}"),
+                        indent(3),
+                        ParentNode(
+                            "p",
+                            [
+                                LeafNode(None, f"Returns the\n      value of entry {i}, see\n      "),
+                                LeafNode("a", "the  index", {"href": "/index"}),
+                                LeafNode(None, "\n      for  details."),
+                            ],
+                        ),
+                        indent(3),
+                        ParentNode("pre", [LeafNode("code", f"def function_{i}(x):\n    return x  +  {i}\n")]),
+                        indent(2),
+                    ],
+                ),
+            ]
+        )
+    sections.append(indent(0))
+    return ParentNode("body", sections)
+
+
+def main():
+    print(f"{'entries':>8} {'full B':>10} {'minified B':>11} {'saved B':>9} {'saved':>7}")
+    for entries in (10, 100, 1000):
+        page = make_reference_page(entries)
+        full = len(page.to_html().encode())
+        minified = len(page.to_html(minify=True).encode())
+        saved = full - minified
+        print(f"{entries:>8} {full:>10} {minified:>11} {saved:>9} {saved / full:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import io
+import timeit
+
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+def make_document(sections=1000, items=98):
+    # 1000 sections of a heading, a list and 98 items: 100k nodes in total
+    body = []
+    for i in range(sections):
+        items_nodes = [
+            LeafNode("li", f"Item {j} of section {i}") for j in range(items - 1)
+        ]
+        items_nodes.append(LeafNode("a", "more", {"href": f"/section/{i}"}))
+        body.append(LeafNode("h2", f"Section {i}"))
+        body.append(ParentNode("ul", items_nodes, {"class": "items"}))
+
+    return ParentNode("body", body)
+
+
+def count_nodes(node):
+    if not node.children:
+        return 1
+    return 1 + sum(count_nodes(child) for child in node.children)
+
+
+def concat_to_html(node):
+    # the previous implementation: every level returns a fresh string that
+    # its parent copies again
+    if isinstance(node, LeafNode):
+        return node.to_html()
+
+    buffer = f"<{node.tag}{' ' + node.props_to_html() if node.props else ''}>"
+    for child in node.children:
+        buffer += concat_to_html(child)
+    buffer += f"</{node.tag}>"
+    return buffer
+
+
+def write_to_stream(node):
+    out = io.StringIO()
+    node.write_html(out)
+    return out
+
+
+def main():
+    document = make_document()
+    assert concat_to_html(document) == document.to_html()
+
+    print(f"nodes: {count_nodes(document)}")
+    for name, func in (
+        ("concatenation", concat_to_html),
+        ("to_html", lambda node: node.to_html()),
+        ("write_html", write_to_stream),
+    ):
+        seconds = min(timeit.repeat(lambda: func(document), number=5, repeat=3)) / 5
+        print(f"{name:>14}: {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
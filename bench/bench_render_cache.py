@@ -0,0 +1,67 @@
+import time
+
+from bench_markdown import make_doc_page
+from block_to_html import markdown_to_html_node
+from render_cache import RenderCache
+
+
+# a live preview of a 5,102-block page as the converter builds it, where each
+# keystroke edits one paragraph and the tree is either edited in place or
+# converted again. the docs page has short blocks, which are never cached
+# since they render faster than they are looked up, so the cache only adds
+# the cost of checking them; the prose page has paragraphs of about a
+# thousand characters with text to escape, which is where it pays off.
+DOCS = make_doc_page(0, sections=850)
+SENTENCE = "Lorem ipsum dolor sit amet & consectetur <adipiscing> elit, sed do eiusmod tempor. "
+PROSE = "\n\n".join(
+    ["# Prose"] + [f"Paragraph {i}. {SENTENCE * 6}**bold words** {SENTENCE * 6}[a link](/page/{i})" for i in range(5101)]
+)
+EDITS = 20
+
+
+def time_renders(trees, render):
+    total = 0
+    for tree in trees:
+        start = time.perf_counter()
+        render(tree())
+        total += time.perf_counter() - start
+    return total / EDITS
+
+
+def edited_in_place(markdown):
+    document = markdown_to_html_node(markdown)
+    paragraph = document.children[len(document.children) // 2]
+    edits = iter(range(10**9))
+
+    def edit():
+        paragraph.children[0].value = f"Edited {next(edits)} "
+        return document
+
+    return [edit] * EDITS
+
+
+def converted_again(markdown):
+    # converted up front, so only the rendering is timed
+    middle = markdown.index("\n\n", len(markdown) // 2)
+    trees = [markdown_to_html_node(f"{markdown[:middle]} edit {i}{markdown[middle:]}") for i in range(EDITS)]
+    return [lambda tree=tree: tree for tree in trees]
+
+
+def main():
+    for page, markdown in (("docs", DOCS), ("prose", PROSE)):
+        for name, make_trees in (("edited in place", edited_in_place), ("converted again", converted_again)):
+            cache = RenderCache()
+            markdown_to_html_node(markdown).to_html(cache=cache)
+            trees = make_trees(markdown)
+
+            cached = min(time_renders(trees, lambda tree: tree.to_html(cache=cache)) for _ in range(7))
+            full = min(time_renders(trees, lambda tree: tree.to_html()) for _ in range(7))
+            tree = trees[-1]()
+            assert tree.to_html(cache=cache) == tree.to_html()
+
+            label = f"{page}, {name}"
+            print(f"{label:>22}: full to_html {full * 1000:6.2f} ms, cached {cached * 1000:6.2f} ms per edit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import time
+
+from bench_markdown import make_doc_page
+from site_builder import build_site
+
+
+PAGES = 20000
+
+
+def timed(build):
+    start = time.perf_counter()
+    report = build()
+    return time.perf_counter() - start, report
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        content = os.path.join(tmp, "content")
+        dest = os.path.join(tmp, "public")
+        template = os.path.join(tmp, "template.html")
+
+        with open(template, "w") as f:
+            f.write("<html><title>{{ Title }}</title><body>{{ Content }}</body></html>")
+
+        for i in range(PAGES):
+            directory = os.path.join(content, f"section{i % 100}")
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"page{i}.md"), "w") as f:
+                f.write(make_doc_page(i, sections=2))
+
+        def build():
+            return build_site(content, template, dest)
+
+        for name in ("full build", "no-op rebuild"):
+            seconds, report = timed(build)
+            print(f"{name:>16}: {seconds:6.2f}s ({len(report.built)} built, {len(report.skipped)} skipped)")
+
+        changed = os.path.join(content, "section7", "page7.md")
+        with open(changed, "a") as f:
+            f.write("\nOne more paragraph.\n")
+        seconds, report = timed(build)
+        print(f"{'one page changed':>16}: {seconds:6.2f}s ({len(report.built)} built, {len(report.skipped)} skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import timeit
+
+from templates import CompiledTemplate
+
+
+PAGES = 20000
+
+# one shared layout of a few kilobytes, as a docs site would have
+LAYOUT = (
+    "<!doctype html><html><head><meta charset=\"utf-8\"><title>{{ Title }} | Docs</title>"
+    + "<link rel=\"stylesheet\" href=\"/style.css\">" * 10
+    + "</head><body><header><nav>"
+    + "".join(f'<a href="/section/{i}">Section {i}</a>' for i in range(60))
+    + "</nav></header><main><h1>{{ Title }}</h1>{{ Content }}</main><footer>"
+    + "<p>Generated documentation, all rights reserved.</p>" * 20
+    + "</footer></body></html>"
+)
+
+
+def replace_render(layout, title, content):
+    return layout.replace("{{ Title }}", title).replace("{{ Content }}", content)
+
+
+def main():
+    pages = [(f"Page {i}", f"<p>Body of page {i}</p>" * 200) for i in range(PAGES)]
+    template = CompiledTemplate(LAYOUT)
+
+    assert template.render({"Title": "t", "Content": "c"}) == replace_render(LAYOUT, "t", "c")
+
+    def with_replace():
+        for title, content in pages:
+            replace_render(LAYOUT, title, content)
+
+    def with_compiled():
+        for title, content in pages:
+            template.render({"Title": title, "Content": content})
+
+    print(f"layout: {len(LAYOUT)} chars, {PAGES} pages")
+    for name, func in (("str.replace", with_replace), ("compiled", with_compiled)):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import timeit
+
+from inline_parser import parse_inline
+from text_to_html import text_to_html, textnodes_to_html
+
+
+PARAGRAPH = " ".join(
+    [
+        "Plain words with **bold text**, _italic text_, `some_code()`,",
+        "a [link to the docs](https://example.com/docs/page) and",
+        "an ![image](https://example.com/img.png).",
+    ]
+    * 20
+)
+
+
+def via_leafnodes(nodes):
+    return "".join(text_to_html(node).to_html() for node in nodes)
+
+
+def main():
+    nodes = parse_inline(PARAGRAPH)
+    assert via_leafnodes(nodes) == textnodes_to_html(nodes)
+
+    print(f"spans: {len(nodes)}")
+    for name, func in (("LeafNode path", via_leafnodes), ("direct", textnodes_to_html)):
+        seconds = min(timeit.repeat(lambda: func(nodes), number=2000, repeat=5)) / 2000
+        print(f"{name:>14}: {seconds * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import io
+import unittest
+
+from arena import ArenaDocument
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+def make_tree():
+    return ParentNode(
+        "div",
+        [
+            LeafNode("h1", "Title"),
+            ParentNode(
+                "ul",
+                [LeafNode("li", "one"), LeafNode("li", "two & more")],
+                {"class": "list"},
+            ),
+            ParentNode("p", [LeafNode(None, "see "), LeafNode("a", "docs", {"href": "/d?a=1&b=2"})]),
+            LeafNode("img", "", {"src": "x.png", "alt": "x"}),
+        ],
+    )
+
+
+class TestArenaDocument(unittest.TestCase):
+    def test_renders_like_the_tree(self):
+        tree = make_tree()
+        self.assertEqual(ArenaDocument.from_node(tree).to_html(), tree.to_html())
+
+    def test_nodes_are_stored_in_pre_order(self):
+        document = ArenaDocument.from_node(make_tree())
+        tags = [document.strings[t] for t in document.tags]
+        self.assertEqual(tags, ["div", "h1", "ul", "li", "li", "p", None, "a", "img"])
+        self.assertEqual(document.first_child[0], 1)
+        self.assertEqual(document.next_sibling[1], 2)
+        self.assertEqual(document.first_child[2], 3)
+        self.assertEqual(document.next_sibling[4], -1)
+
+    def test_strings_are_stored_once(self):
+        tree = ParentNode("ul", [LeafNode("li", "same") for _ in range(50)])
+        document = ArenaDocument.from_node(tree)
+
+        self.assertEqual(len(document), 51)
+        self.assertEqual(document.strings, [None, "ul", "li", "same"])
+
+    def test_round_trip(self):
+        tree = make_tree()
+        rebuilt = ArenaDocument.from_node(tree).to_node()
+
+        self.assertIsInstance(rebuilt, ParentNode)
+        self.assertEqual(rebuilt.to_html(), tree.to_html())
+        self.assertEqual(rebuilt.children[1].props, {"class": "list"})
+        self.assertIsInstance(rebuilt.children[0], LeafNode)
+
+    def test_single_leaf(self):
+        document = ArenaDocument.from_node(LeafNode("b", "bold"))
+        self.assertEqual(document.to_html(), "<b>bold</b>")
+        self.assertEqual(document.to_node().to_html(), "<b>bold</b>")
+
+    def test_closes_nested_parents_after_last_child(self):
+        tree = ParentNode("a", [ParentNode("b", [ParentNode("c", [LeafNode("i", "x")])]), LeafNode("i", "y")])
+        self.assertEqual(ArenaDocument.from_node(tree).to_html(), tree.to_html())
+
+    def test_deep_nesting(self):
+        node = LeafNode("span", "leaf")
+        for _ in range(5000):
+            node = ParentNode("div", [node])
+
+        document = ArenaDocument.from_node(node)
+        self.assertEqual(document.to_html(), node.to_html())
+        self.assertEqual(document.to_node().to_html(), node.to_html())
+
+    def test_write_html(self):
+        tree = make_tree()
+        out = io.StringIO()
+        ArenaDocument.from_node(tree).write_html(out)
+        self.assertEqual(out.getvalue(), tree.to_html())
+
+    def test_invalid_nodes_raise(self):
+        with self.assertRaises(ValueError):
+            ArenaDocument.from_node(ParentNode("div", []))
+        with self.assertRaises(ValueError):
+            ArenaDocument.from_node(ParentNode("div", [LeafNode("p", "")]))
+
+    def test_empty_document_to_node_raises(self):
+        with self.assertRaises(ValueError):
+            ArenaDocument().to_node()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from block_to_html import code_block_to_html_node, markdown_to_html_node
+from markdown_to_textnode import clear_inline_cache, inline_cache_info
+
+
+class TestCodeBlockToHtmlNode(unittest.TestCase):
+    def test_code_is_not_inline_parsed(self):
+        lines = ["```", "This is **not** _parsed_", "", "`ever`", "```"]
+        node = code_block_to_html_node(lines)
+        self.assertEqual(
+            node.to_html(),
+            "<pre><code>This is **not** _parsed_\n\n`ever`\n</code></pre>",
+        )
+
+    def test_empty_code_block(self):
+        node = code_block_to_html_node(["```", "```"])
+        self.assertEqual(node.to_html(), "<pre><code>\n</code></pre>")
+
+
+class TestMarkdownToHtmlNode(unittest.TestCase):
+    def test_paragraphs(self):
+        md = """
+This is **bolded** paragraph
+text in a p
+tag here
+
+This is another paragraph with _italic_ text and `code` here
+
+"""
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p>"
+            "<p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
+        )
+
+    def test_headings(self):
+        md = "# Title\n\n### A *small* heading\n\n####### not a heading"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><h1>Title</h1><h3>A <i>small</i> heading</h3><p>####### not a heading</p></div>",
+        )
+
+    def test_code_block(self):
+        md = """
+```
+This is text that _should_ remain
+the **same** even with inline stuff
+
+```
+"""
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n\n</code></pre></div>",
+        )
+
+    def test_quote(self):
+        md = "> A quote with **bold**\n> over two lines"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><blockquote>A quote with <b>bold</b> over two lines</blockquote></div>",
+        )
+
+    def test_lists(self):
+        md = "- one\n- [two](/two)\n\n1. first\n2. _second_"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            '<div><ul><li>one</li><li><a href="/two">two</a></li></ul>'
+            "<ol><li>first</li><li><i>second</i></li></ol></div>",
+        )
+
+    def test_empty_list_items(self):
+        self.assertEqual(
+            markdown_to_html_node("- a\n- \n- b").to_html(),
+            "<div><ul><li>a</li><li>\n</li><li>b</li></ul></div>",
+        )
+        self.assertEqual(
+            markdown_to_html_node("1. a\n2. \n3. c").to_html(),
+            "<div><ol><li>a</li><li>\n</li><li>c</li></ol></div>",
+        )
+
+    def test_empty_document(self):
+        self.assertEqual(markdown_to_html_node("").to_html(), "<div>\n</div>")
+        self.assertEqual(markdown_to_html_node("   \n\n").to_html(), "<div>\n</div>")
+
+    def test_image_paragraph(self):
+        md = "![alt text](/img.png)"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            '<div><p><img src="/img.png" alt="alt text"></p></div>',
+        )
+
+    def test_repeated_text_is_parsed_once(self):
+        clear_inline_cache()
+        md = "Shared **footer** text"
+        self.assertEqual(markdown_to_html_node(md).to_html(), markdown_to_html_node(md).to_html())
+        self.assertEqual((inline_cache_info().hits, inline_cache_info().misses), (1, 1))
+
+    def test_text_is_escaped(self):
+        md = "a < b & c"
+        self.assertEqual(markdown_to_html_node(md).to_html(), "<div><p>a &lt; b &amp; c</p></div>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from block_parser import block_to_block_type, BlockType
+from block_parser import block_to_block_type, classify_block, code_block_text, BlockType
 
 
 class TestBlockToBlockType(unittest.TestCase):
@@ -241,5 +241,48 @@ echo 'hello'
         self.assertEqual(result, BlockType.PARAGRAPH)
 
 
+class TestClassifyBlock(unittest.TestCase):
+    def test_heading_levels(self):
+        for level in range(1, 7):
+            with self.subTest(level=level):
+                info = classify_block("#" * level + " Title")
+                self.assertEqual(info.block_type, BlockType.HEADING)
+                self.assertEqual(info.level, level)
+
+    def test_seven_hashes_is_paragraph(self):
+        info = classify_block("####### Too deep")
+        self.assertEqual(info.block_type, BlockType.PARAGRAPH)
+        self.assertIsNone(info.level)
+
+    def test_returns_split_lines(self):
+        info = classify_block("1. one\n2. two\n3. three")
+        self.assertEqual(info.block_type, BlockType.ORDERED_LIST)
+        self.assertEqual(info.lines, ["1. one", "2. two", "3. three"])
+
+    def test_ordered_list_out_of_sequence(self):
+        info = classify_block("1. one\n3. three")
+        self.assertEqual(info.block_type, BlockType.PARAGRAPH)
+
+    def test_paragraph_lines(self):
+        info = classify_block("plain\ntext")
+        self.assertEqual(info, (BlockType.PARAGRAPH, ["plain", "text"], None))
+
+
+class TestCodeBlockText(unittest.TestCase):
+    def test_fenced_content(self):
+        lines = ["```", "x = 1", "", "y = 2", "    ```"]
+        self.assertEqual(code_block_text(lines), "x = 1\n\ny = 2\n")
+
+    def test_single_line(self):
+        self.assertEqual(code_block_text(["```print('hi')```"]), "print('hi')")
+
+    def test_empty(self):
+        self.assertEqual(code_block_text(["```", "```"]), "")
+
+    def test_content_on_closing_fence_line(self):
+        self.assertEqual(code_block_text(["```", "code here", "more```"]), "code here\nmore\n")
+        self.assertEqual(code_block_text(["```", "x```"]), "x\n")
+
+
 if __name__ == "__main__":
     unittest.main()
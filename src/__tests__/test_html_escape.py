@@ -0,0 +1,40 @@
+import unittest
+
+from html_escape import escape_text, escape_attribute
+
+
+class TestEscapeText(unittest.TestCase):
+    def test_plain_text_is_returned_unchanged(self):
+        text = "Nothing to escape, not even 'quotes' or \"doubles\""
+        self.assertIs(escape_text(text), text)
+
+    def test_special_characters(self):
+        self.assertEqual(escape_text("a < b && c > d"), "a &lt; b &amp;&amp; c &gt; d")
+
+    def test_ampersand_escaped_first(self):
+        self.assertEqual(escape_text("&lt;"), "&amp;lt;")
+
+
+class TestEscapeAttribute(unittest.TestCase):
+    def test_quotes_are_escaped(self):
+        self.assertEqual(escape_attribute('say "hi"'), "say &quot;hi&quot;")
+
+    def test_query_string_ampersand(self):
+        result = escape_attribute("https://example.com/?q=1&type=web")
+        self.assertEqual(result, "https://example.com/?q=1&amp;type=web")
+
+    def test_single_quotes_are_kept(self):
+        self.assertEqual(escape_attribute("It's"), "It's")
+
+    def test_repeated_values_are_memoized(self):
+        escape_attribute.cache_clear()
+        escape_attribute("/docs/index.html")
+        escape_attribute("/docs/index.html")
+        self.assertEqual(escape_attribute.cache_info().hits, 1)
+
+    def test_non_string_values(self):
+        self.assertEqual(escape_attribute(2), "2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
-from htmlnode import HTMLNode
+from htmlnode import HTMLNode, OPEN_TAGS, CLOSE_TAGS
+from leafnode import LeafNode
+from parentnode import ParentNode
 
 
 class TestHTMLNode(unittest.TestCase):
@@ -90,8 +92,8 @@ class TestHTMLNode(unittest.TestCase):
         node = HTMLNode("div", None, None, props)
 
         result = node.props_to_html()
-        self.assertIn('data-value="test & example"', result)
-        self.assertIn('title="Quote "test""', result)
+        self.assertIn('data-value="test &amp; example"', result)
+        self.assertIn('title="Quote &quot;test&quot;"', result)
 
     def test_to_html_not_implemented(self):
         node = HTMLNode("div", "content")
@@ -170,6 +172,41 @@ class TestHTMLNode(unittest.TestCase):
 
         self.assertEqual(node.value, "This has <special> & 'quoted' \"characters\"")
 
+    def test_slotted_hierarchy_without_instance_dict(self):
+        leaf = LeafNode("p", "text")
+        nodes = [HTMLNode("div"), leaf, ParentNode("div", [leaf])]
+        for node in nodes:
+            with self.subTest(node=type(node).__name__):
+                self.assertFalse(hasattr(node, "__dict__"))
+
+
+class TestTagAndPropsCaching(unittest.TestCase):
+    def test_tag_strings_are_shared(self):
+        self.assertEqual(OPEN_TAGS["section"], "<section>")
+        self.assertEqual(CLOSE_TAGS["section"], "</section>")
+        self.assertIs(OPEN_TAGS["section"], OPEN_TAGS["section"])
+
+    def test_props_rendering_is_reused(self):
+        node = HTMLNode("a", None, None, {"href": "/docs", "class": "nav"})
+        self.assertIs(node.props_to_html(), node.props_to_html())
+
+    def test_props_changed_in_place_invalidate_cache(self):
+        node = LeafNode("a", "Docs", {"href": "/docs"})
+        self.assertEqual(node.to_html(), '<a href="/docs">Docs</a>')
+
+        node.props["href"] = "/guide"
+        self.assertEqual(node.to_html(), '<a href="/guide">Docs</a>')
+
+    def test_props_replaced_invalidate_cache(self):
+        node = ParentNode("nav", [LeafNode(None, "x")], {"class": "a"})
+        self.assertEqual(node.to_html(), '<nav class="a">x</nav>')
+
+        node.props = {"class": "b"}
+        self.assertEqual(node.to_html(), '<nav class="b">x</nav>')
+
+        node.props = None
+        self.assertEqual(node.to_html(), "<nav>x</nav>")
+
 
 if __name__ == "__main__":
     unittest.main()
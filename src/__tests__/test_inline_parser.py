@@ -0,0 +1,193 @@
+import time
+import unittest
+
+from textnode import TextNode, TextType
+from inline_parser import parse_inline
+from markdown_to_textnode import text_to_textnodes_multipass
+
+
+class TestParseInline(unittest.TestCase):
+    def test_empty_input(self):
+        self.assertListEqual(parse_inline(""), [])
+
+    def test_plain_text(self):
+        result = parse_inline("Nothing special here.")
+        self.assertListEqual(result, [TextNode("Nothing special here.", TextType.TEXT)])
+
+    def test_all_span_types(self):
+        text = "**b** _i_ *j* `c` ![img](a.png) [link](b.html)"
+        result = parse_inline(text)
+        expected = [
+            TextNode("b", TextType.BOLD),
+            TextNode(" ", TextType.TEXT),
+            TextNode("i", TextType.ITALIC),
+            TextNode(" ", TextType.TEXT),
+            TextNode("j", TextType.ITALIC),
+            TextNode(" ", TextType.TEXT),
+            TextNode("c", TextType.CODE),
+            TextNode(" ", TextType.TEXT),
+            TextNode("img", TextType.IMAGE, "a.png"),
+            TextNode(" ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "b.html"),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_link_text_is_not_parsed(self):
+        result = parse_inline("[a **bold** link](x.com)")
+        self.assertListEqual(result, [TextNode("a **bold** link", TextType.LINK, "x.com")])
+
+    def test_unmatched_delimiter_keeps_other_spans(self):
+        text = "A [link](x.com) then **bold** and a stray `tick"
+        result = parse_inline(text)
+        expected = [
+            TextNode("A ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "x.com"),
+            TextNode(" then ", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode(" and a stray `tick", TextType.TEXT),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_unclosed_opener_is_literal(self):
+        result = parse_inline("**open and _closed_ here")
+        expected = [
+            TextNode("**open and ", TextType.TEXT),
+            TextNode("closed", TextType.ITALIC),
+            TextNode(" here", TextType.TEXT),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_leftover_delimiter_characters_are_literal(self):
+        result = parse_inline("**bold* text")
+        expected = [
+            TextNode("*", TextType.TEXT),
+            TextNode("bold", TextType.ITALIC),
+            TextNode(" text", TextType.TEXT),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_emphasis_can_contain_link(self):
+        text = "**a [l](u) b**"
+        result = parse_inline(text)
+        expected = [
+            TextNode(
+                "a l b",
+                TextType.BOLD,
+                None,
+                [
+                    TextNode("a ", TextType.TEXT),
+                    TextNode("l", TextType.LINK, "u"),
+                    TextNode(" b", TextType.TEXT),
+                ],
+            )
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_nested_bold_and_italic(self):
+        result = parse_inline("**bold _italic_**")
+        expected = [
+            TextNode(
+                "bold italic",
+                TextType.BOLD,
+                None,
+                [
+                    TextNode("bold ", TextType.TEXT),
+                    TextNode("italic", TextType.ITALIC),
+                ],
+            )
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_triple_delimiter_nests(self):
+        result = parse_inline("***both***")
+        expected = [
+            TextNode("both", TextType.ITALIC, None, [TextNode("both", TextType.BOLD)])
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_intraword_underscore_is_literal(self):
+        result = parse_inline("call snake_case_name with *care*")
+        expected = [
+            TextNode("call snake_case_name with ", TextType.TEXT),
+            TextNode("care", TextType.ITALIC),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_code_span_content_is_literal(self):
+        result = parse_inline("`a *b* c`")
+        self.assertListEqual(result, [TextNode("a *b* c", TextType.CODE)])
+
+    def test_spaced_asterisks_are_literal(self):
+        result = parse_inline("2 * 3 * 4")
+        self.assertListEqual(result, [TextNode("2 * 3 * 4", TextType.TEXT)])
+
+    def test_opener_that_can_close_is_matched_first_as_closer(self):
+        result = parse_inline("*a*b*")
+        self.assertListEqual(result, [TextNode("a", TextType.ITALIC), TextNode("b*", TextType.TEXT)])
+
+    def test_lone_backtick_is_literal(self):
+        result = parse_inline("a ` b **c**")
+        self.assertListEqual(result, [TextNode("a ` b ", TextType.TEXT), TextNode("c", TextType.BOLD)])
+
+    def test_matches_multipass_pipeline(self):
+        samples = [
+            "This is **text** with an _italic_ word and a `code block` and an "
+            "![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a "
+            "[link](https://boot.dev)",
+            "Adjacent markdown: ![image](img.png)[link](link.com)**bold**",
+            "**Bold** at the beginning.",
+            "Text `code1``code2` more text",
+            "This has a [malformed link and **unclosed bold.",
+            "Some **bold text** and some *italic text*.",
+            "![a](b) ![c](d) [e](f) [g](h)",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertListEqual(parse_inline(text), text_to_textnodes_multipass(text))
+
+
+class TestParseInlineScaling(unittest.TestCase):
+    # each pattern is parsed at two sizes; a linear parser takes about 4x as
+    # long for 4x the input, a quadratic one about 16x
+    PATTERNS = [
+        "*",
+        "*a ",
+        "a* ",
+        "*a _b ",
+        "**a *b ",
+        "*a **b ",
+        "_a __b ",
+        "*a **b ***c ",
+        "**a _b *c ",
+        "_a*",
+        "[a](b) *c ",
+        "`",
+    ]
+
+    def time_parse(self, text):
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            parse_inline(text)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        return best
+
+    def test_pathological_inputs_scale_linearly(self):
+        for pattern in self.PATTERNS:
+            with self.subTest(pattern=pattern):
+                small = self.time_parse(pattern * 5000)
+                large = self.time_parse(pattern * 20000)
+                self.assertLess(large, max(small, 1e-3) * 10)
+
+    def test_hundred_thousand_unmatched_asterisks(self):
+        text = "word" + "*" * 100000
+        start = time.perf_counter()
+        result = parse_inline(text)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertListEqual(result, [TextNode(text, TextType.TEXT)])
+
+
+if __name__ == "__main__":
+    unittest.main()
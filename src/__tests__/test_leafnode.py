@@ -70,7 +70,7 @@ class TestLeafNode(unittest.TestCase):
         node = LeafNode("p", "Text with <special> & 'characters'")
 
         result = node.to_html()
-        self.assertEqual(result, "<p>Text with <special> & 'characters'</p>")
+        self.assertEqual(result, "<p>Text with &lt;special&gt; &amp; 'characters'</p>")
 
     def test_to_html_raises_error_with_no_value(self):
         node = LeafNode("p", None)
@@ -146,7 +146,7 @@ class TestLeafNode(unittest.TestCase):
 
         result = node.to_html()
         # Props should be properly escaped/handled
-        self.assertIn('title="Say "Hello" to user"', result)
+        self.assertIn('title="Say &quot;Hello&quot; to user"', result)
         self.assertIn('data-info="It\'s working"', result)
 
     def test_inheritance_from_htmlnode(self):
@@ -168,6 +168,20 @@ class TestLeafNode(unittest.TestCase):
         self.assertIn("p", repr_str)
         self.assertIn("Test content", repr_str)
 
+    def test_void_element_without_value(self):
+        node = LeafNode("img", "", {"src": "image.jpg", "alt": "Description"})
+
+        result = node.to_html()
+        self.assertEqual(result, '<img src="image.jpg" alt="Description">')
+
+    def test_minify_collapses_whitespace(self):
+        node = LeafNode("p", "  spread \n\n over\tlines  ")
+        self.assertEqual(node.to_html(minify=True), "<p> spread over lines </p>")
+
+    def test_minify_keeps_code_whitespace(self):
+        node = LeafNode("code", "a  =\n  1")
+        self.assertEqual(node.to_html(minify=True), "<code>a  =\n  1</code>")
+
 
 if __name__ == "__main__":
     unittest.main()
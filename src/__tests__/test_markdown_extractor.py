@@ -2,7 +2,12 @@ import unittest
 
 # Assuming your functions will be in a file named markdown_extractor.py
 # You would replace this with the actual import
-from markdown_extractor import extract_markdown_images, extract_markdown_links
+from markdown_extractor import (
+    extract_markdown_images,
+    extract_markdown_links,
+    find_markdown_images,
+    find_markdown_links,
+)
 
 
 class TestExtractMarkdownImages(unittest.TestCase):
@@ -160,5 +165,27 @@ class TestExtractMarkdownLinks(unittest.TestCase):
                 self.assertListEqual(extract_markdown_links(text), [])
 
 
+class TestFindMarkdownMatches(unittest.TestCase):
+    def test_image_spans_and_groups(self):
+        text = "a ![one](1.png) b ![two](2.png)"
+        result = [(m.span(), m.groups()) for m in find_markdown_images(text)]
+        expected = [
+            ((2, 15), ("one", "1.png")),
+            ((18, 31), ("two", "2.png")),
+        ]
+        self.assertListEqual(result, expected)
+
+    def test_link_spans_skip_images(self):
+        text = "![img](i.png) and [link](l.html)"
+        result = [(m.span(), m.groups()) for m in find_markdown_links(text)]
+        self.assertListEqual(result, [((18, 32), ("link", "l.html"))])
+
+    def test_spans_slice_back_to_source(self):
+        text = "see [docs](https://example.com/docs) now"
+        for match in find_markdown_links(text):
+            start, end = match.span()
+            self.assertEqual(text[start:end], "[docs](https://example.com/docs)")
+
+
 if __name__ == "__main__":
     unittest.main()
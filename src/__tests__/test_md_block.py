@@ -1,5 +1,12 @@
+import io
 import unittest
-from md_to_block import markdown_to_blocks
+from block_parser import BlockType
+from md_to_block import (
+    markdown_to_blocks,
+    iter_markdown_blocks,
+    markdown_block_index,
+    scan_blocks,
+)
 
 
 class TestMarkdownToBlocks(unittest.TestCase):
@@ -155,6 +162,106 @@ Second paragraph.
         blocks = markdown_to_blocks(md)
         self.assertEqual(blocks, ["``````"])
 
+    def test_many_runs_of_blank_lines(self):
+        md = "one\n\n\n\n\ntwo\n\n\n\nthree\n\n\n\n\n\n"
+        blocks = markdown_to_blocks(md)
+        self.assertEqual(blocks, ["one", "two", "three"])
+
+    def test_fenced_code_with_blank_lines_stays_whole(self):
+        md = "Intro\n\n```\ndef f():\n\n\n    return 1\n```\n\nOutro"
+        blocks = markdown_to_blocks(md)
+        self.assertEqual(
+            blocks,
+            ["Intro", "```\ndef f():\n\n\n    return 1\n```", "Outro"],
+        )
+
+    def test_one_line_fences_do_not_open_a_block(self):
+        md = "```inline```\n\n``````\n\nnext"
+        blocks = markdown_to_blocks(md)
+        self.assertEqual(blocks, ["```inline```", "``````", "next"])
+
+    def test_fence_closed_at_end_of_content_line(self):
+        md = "```\ncode```\n\nA paragraph after.\n\n- item"
+        expected = ["```\ncode```", "A paragraph after.", "- item"]
+        self.assertEqual(markdown_to_blocks(md), expected)
+        self.assertEqual(list(iter_markdown_blocks(md.split("\n"))), expected)
+
+
+class TestMarkdownBlockIndex(unittest.TestCase):
+    def test_offsets_slice_blocks(self):
+        md = "\n# Title\n\n  Para line one\nline two  \n\n\n- item\n"
+        index = markdown_block_index(md)
+        self.assertEqual(
+            [md[start:end] for start, end, _ in index],
+            ["# Title", "Para line one\nline two", "- item"],
+        )
+
+    def test_start_lines(self):
+        md = "\n# Title\n\n  Para line one\nline two  \n\n\n- item\n"
+        index = markdown_block_index(md)
+        self.assertEqual([span.line for span in index], [2, 4, 8])
+
+    def test_empty_and_blank_documents(self):
+        self.assertEqual(markdown_block_index(""), [])
+        self.assertEqual(markdown_block_index("\n\n  \n\n"), [])
+
+
+class TestIterMarkdownBlocks(unittest.TestCase):
+    DOCUMENTS = [
+        "",
+        "   \n   \n   ",
+        "This is a single paragraph with some text.",
+        "\n\nFirst paragraph.\n\n\nSecond paragraph.\n\n",
+        "# Heading\n\n- one\n- two\n\n> quote\n> more\n\n1. a\n2. b\n",
+        "  indented start\nsecond line   \n\n\n\n\nlast",
+        "text\n\n```\ncode\n\n\nmore code\n    ```\n\n```\nunclosed\n\n",
+    ]
+
+    def test_matches_markdown_to_blocks_on_file(self):
+        for md in self.DOCUMENTS:
+            with self.subTest(md=md):
+                blocks = list(iter_markdown_blocks(io.StringIO(md)))
+                self.assertEqual(blocks, markdown_to_blocks(md))
+
+    def test_accepts_lines_without_newlines(self):
+        lines = ["First", "still first", "", "", "Second"]
+        blocks = list(iter_markdown_blocks(iter(lines)))
+        self.assertEqual(blocks, ["First\nstill first", "Second"])
+
+    def test_yields_before_input_is_exhausted(self):
+        def lines():
+            yield "First block\n"
+            yield "\n"
+            raise AssertionError("read past the first block")
+
+        blocks = iter_markdown_blocks(lines())
+        self.assertEqual(next(blocks), "First block")
+
+
+class TestScanBlocks(unittest.TestCase):
+    def test_yields_classified_blocks(self):
+        md = "# Title\n\n```\nx = 1\n\ny = 2\n```\n\n- a\n- b\n\nplain text"
+        blocks = list(scan_blocks(io.StringIO(md)))
+
+        self.assertEqual(
+            [block.block_type for block in blocks],
+            [
+                BlockType.HEADING,
+                BlockType.CODE,
+                BlockType.UNORDERED_LIST,
+                BlockType.PARAGRAPH,
+            ],
+        )
+        self.assertEqual(blocks[0].level, 1)
+        self.assertEqual(blocks[1].lines, ["```", "x = 1", "", "y = 2", "```"])
+
+    def test_lines_are_trimmed_like_blocks(self):
+        md = "   \n  - a\n- b   \n  \n"
+        blocks = list(scan_blocks(md.split("\n")))
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0].lines, ["- a", "- b"])
+        self.assertEqual(blocks[0].block_type, BlockType.UNORDERED_LIST)
+
 
 if __name__ == "__main__":
     unittest.main()
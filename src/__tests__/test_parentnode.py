@@ -1,5 +1,7 @@
+import io
 import unittest
 
+from htmlnode import HTMLNode
 from parentnode import ParentNode
 from leafnode import LeafNode
 
@@ -239,5 +241,173 @@ class TestParentNode(unittest.TestCase):
         self.assertIn("div", repr_str)
 
 
+class TestParentNodeStreaming(unittest.TestCase):
+    def make_tree(self):
+        return ParentNode(
+            "div",
+            [
+                ParentNode("p", [LeafNode("b", "Bold"), LeafNode(None, " text")]),
+                LeafNode("a", "Link", {"href": "https://example.com"}),
+            ],
+            {"class": "page"},
+        )
+
+    def test_render_into_appends_pieces(self):
+        buffer = ["<!doctype html>"]
+        self.make_tree().render_into(buffer)
+
+        self.assertGreater(len(buffer), 2)
+        self.assertEqual("".join(buffer[1:]), self.make_tree().to_html())
+
+    def test_write_html_to_stream(self):
+        out = io.StringIO()
+        self.make_tree().write_html(out)
+        self.assertEqual(
+            out.getvalue(),
+            '<div class="page"><p><b>Bold</b> text</p><a href="https://example.com">Link</a></div>',
+        )
+
+    def test_child_overriding_only_to_html(self):
+        class Custom(HTMLNode):
+            def to_html(self):
+                return "<hr>"
+
+        node = ParentNode("div", [Custom(), LeafNode("p", "after")])
+        self.assertEqual(node.to_html(), "<div><hr><p>after</p></div>")
+
+    def test_validation_errors_while_streaming(self):
+        node = ParentNode("div", [ParentNode("p", [])])
+
+        with self.assertRaises(ValueError):
+            node.render_into([])
+
+
+class TestParentNodeIterHtml(unittest.TestCase):
+    def make_page(self):
+        return ParentNode(
+            "body",
+            [ParentNode("p", [LeafNode(None, f"Paragraph {i} text.")]) for i in range(200)],
+        )
+
+    def test_chunks_join_to_full_html(self):
+        page = self.make_page()
+        self.assertEqual("".join(page.iter_html(chunk_size=100)), page.to_html())
+
+    def test_chunks_are_bounded(self):
+        chunks = list(self.make_page().iter_html(chunk_size=64))
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks[:-1]:
+            self.assertEqual(len(chunk), 64)
+        self.assertLessEqual(len(chunks[-1]), 64)
+
+    def test_large_leaf_is_split(self):
+        page = ParentNode("pre", [LeafNode("code", "x" * 1000)])
+        chunks = list(page.iter_html(chunk_size=256))
+        self.assertEqual(max(len(chunk) for chunk in chunks), 256)
+        self.assertEqual("".join(chunks), page.to_html())
+
+    def test_first_chunk_before_walk_finishes(self):
+        class Broken(HTMLNode):
+            def to_html(self):
+                raise RuntimeError("rendered too early")
+
+        children = [LeafNode("p", "x" * 100) for _ in range(10)] + [Broken()]
+        chunks = ParentNode("body", children).iter_html(chunk_size=50)
+
+        self.assertEqual(next(chunks), "<body><p>" + "x" * 41)
+
+    def test_rejects_non_positive_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(self.make_page().iter_html(chunk_size=0))
+
+
+class TestParentNodeMinify(unittest.TestCase):
+    def test_default_output_is_unchanged(self):
+        node = ParentNode("div", [LeafNode(None, "\n  "), LeafNode("p", "a  b")])
+        self.assertEqual(node.to_html(), "<div>\n  <p>a  b</p></div>")
+
+    def test_drops_whitespace_between_blocks(self):
+        node = ParentNode(
+            "body",
+            [
+                LeafNode(None, "\n  "),
+                LeafNode("h1", "Title"),
+                LeafNode(None, "\n\n  "),
+                ParentNode("ul", [LeafNode(None, "\n    "), LeafNode("li", "one"), LeafNode(None, "\n")]),
+                LeafNode(None, "\n"),
+            ],
+        )
+        self.assertEqual(node.to_html(minify=True), "<body><h1>Title</h1><ul><li>one</li></ul></body>")
+
+    def test_keeps_whitespace_between_inline_elements(self):
+        node = ParentNode("p", [LeafNode("b", "bold"), LeafNode(None, "\n   "), LeafNode("i", "italic")])
+        self.assertEqual(node.to_html(minify=True), "<p><b>bold</b> <i>italic</i></p>")
+
+    def test_collapses_text_whitespace(self):
+        node = ParentNode("p", [LeafNode(None, "some   text\n\twrapped "), LeafNode("a", "a  link", {"href": "/x"})])
+        self.assertEqual(node.to_html(minify=True), '<p>some text wrapped <a href="/x">a link</a></p>')
+
+    def test_keeps_non_breaking_spaces(self):
+        node = ParentNode("p", [LeafNode(None, "a\u00a0\u00a0b")])
+        self.assertEqual(node.to_html(minify=True), "<p>a\u00a0\u00a0b</p>")
+
+    def test_preformatted_content_is_kept(self):
+        code = "def f():\n    return  1\n"
+        node = ParentNode(
+            "div",
+            [
+                ParentNode("pre", [LeafNode("code", code)]),
+                ParentNode("pre", [LeafNode(None, "\n  "), ParentNode("span", [LeafNode(None, "a   b")])]),
+                ParentNode("p", [LeafNode("code", "x  =  1")]),
+            ],
+        )
+        self.assertEqual(
+            node.to_html(minify=True),
+            f"<div><pre><code>{code}</code></pre><pre>\n  <span>a   b</span></pre><p><code>x  =  1</code></p></div>",
+        )
+
+    def test_streaming_apis_minify(self):
+        node = ParentNode("div", [LeafNode(None, " "), LeafNode("p", "a   b"), LeafNode(None, " ")])
+        expected = node.to_html(minify=True)
+
+        out = io.StringIO()
+        node.write_html(out, minify=True)
+        buffer = []
+        node.render_into(buffer, minify=True)
+
+        self.assertEqual(out.getvalue(), expected)
+        self.assertEqual("".join(buffer), expected)
+        self.assertEqual("".join(node.iter_html(chunk_size=4, minify=True)), expected)
+
+
+class TestParentNodeDeepNesting(unittest.TestCase):
+    def test_depth_beyond_recursion_limit(self):
+        depth = 50000
+        node = LeafNode("span", "deep")
+        for _ in range(depth):
+            node = ParentNode("blockquote", [node])
+
+        expected = "<blockquote>" * depth + "<span>deep</span>" + "</blockquote>" * depth
+        self.assertEqual(node.to_html(), expected)
+
+    def test_matches_recursive_rendering(self):
+        def recursive(node):
+            if isinstance(node, LeafNode):
+                return node.to_html()
+            inner = "".join(recursive(child) for child in node.children)
+            props = f" {node.props_to_html()}" if node.props else ""
+            return f"<{node.tag}{props}>{inner}</{node.tag}>"
+
+        node = ParentNode(
+            "ul",
+            [
+                ParentNode("li", [LeafNode(None, "one"), ParentNode("ol", [LeafNode("li", "a")])]),
+                ParentNode("li", [LeafNode("b", "two")], {"class": "x"}),
+                LeafNode("li", "three"),
+            ],
+        )
+        self.assertEqual(node.to_html(), recursive(node))
+
+
 if __name__ == "__main__":
     unittest.main()
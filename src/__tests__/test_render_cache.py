@@ -0,0 +1,176 @@
+import unittest
+
+from leafnode import LeafNode
+from parentnode import ParentNode
+from render_cache import RenderCache
+
+
+def make_document(blocks=50):
+    return ParentNode(
+        "div",
+        [
+            ParentNode("p", [LeafNode(None, f"Block {i} "), LeafNode("b", "bold"), LeafNode("a", "link", {"href": f"/{i}"})])
+            for i in range(blocks)
+        ],
+    )
+
+
+class CollidingText(str):
+    def __hash__(self):
+        return 0
+
+
+class TestStructuralHash(unittest.TestCase):
+    def test_equal_trees_hash_equal(self):
+        self.assertEqual(make_document().structural_hash(), make_document().structural_hash())
+
+    def test_changed_leaf_changes_hash(self):
+        document = make_document()
+        before = document.structural_hash()
+        document.children[7].children[1].value = "BOLD"
+        self.assertNotEqual(document.structural_hash(), before)
+
+    def test_props_are_part_of_the_hash(self):
+        first = ParentNode("p", [LeafNode("b", "x")], {"class": "a"})
+        second = ParentNode("p", [LeafNode("b", "x")], {"class": "b"})
+        self.assertNotEqual(first.structural_hash(), second.structural_hash())
+
+    def test_leaf_and_parent_hash_differ(self):
+        leaf = LeafNode("p", "x")
+        parent = ParentNode("p", [LeafNode(None, "x")])
+        self.assertNotEqual(leaf.structural_hash(), parent.structural_hash())
+
+
+class TestRenderCache(unittest.TestCase):
+    def test_renders_like_to_html(self):
+        document = make_document()
+        self.assertEqual(document.to_html(cache=RenderCache(min_length=0)), document.to_html())
+
+    def test_second_render_hits_every_paragraph(self):
+        cache = RenderCache(min_length=0)
+        document = make_document()
+        document.to_html(cache=cache)
+        cache.hits = cache.misses = 0
+
+        self.assertEqual(document.to_html(cache=cache), document.to_html())
+        self.assertEqual((cache.hits, cache.misses), (50, 0))
+
+    def test_only_the_dirty_path_is_rendered(self):
+        cache = RenderCache(min_length=0)
+        document = make_document()
+        document.to_html(cache=cache)
+        cache.hits = cache.misses = 0
+
+        document.children[7].children[0].value = "Edited "
+        self.assertEqual(document.to_html(cache=cache), document.to_html())
+        # the edited paragraph misses, the other 49 hit
+        self.assertEqual((cache.hits, cache.misses), (49, 1))
+
+    def test_rebuilt_tree_reuses_fragments(self):
+        cache = RenderCache(min_length=0)
+        make_document().to_html(cache=cache)
+        cache.hits = cache.misses = 0
+
+        make_document().to_html(cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (50, 0))
+
+    def test_parents_with_little_text_are_not_cached(self):
+        cache = RenderCache(min_length=10)
+        document = ParentNode("div", [ParentNode("p", [LeafNode(None, "short")]), ParentNode("p", [LeafNode(None, "long enough")])])
+
+        self.assertEqual(document.to_html(cache=cache), document.to_html())
+        self.assertEqual((len(cache), cache.misses), (1, 1))
+
+    def test_leaf_root(self):
+        self.assertEqual(LeafNode("b", "x").to_html(cache=RenderCache(min_length=0)), "<b>x</b>")
+
+    def test_least_recently_used_entry_is_dropped(self):
+        cache = RenderCache(maxsize=2, min_length=0)
+        first = ParentNode("p", [LeafNode(None, "1")])
+        second = ParentNode("p", [LeafNode(None, "2")])
+        third = ParentNode("p", [LeafNode(None, "3")])
+
+        first.to_html(cache=cache)
+        second.to_html(cache=cache)
+        first.to_html(cache=cache)
+        third.to_html(cache=cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.hits = cache.misses = 0
+        first.to_html(cache=cache)
+        second.to_html(cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_deep_nesting(self):
+        node = LeafNode("span", "leaf")
+        for _ in range(2000):
+            node = ParentNode("div", [node])
+
+        self.assertEqual(node.to_html(cache=RenderCache(min_length=0)), node.to_html())
+
+    def test_deep_nesting_renders_again_from_the_cache(self):
+        node = LeafNode("span", "leaf")
+        for _ in range(5000):
+            node = ParentNode("div", [node])
+
+        cache = RenderCache(min_length=0)
+        expected = node.to_html()
+        self.assertEqual(node.to_html(cache=cache), expected)
+        self.assertEqual(node.to_html(cache=cache), expected)
+        self.assertGreater(cache.hits, 0)
+
+    def test_invalid_tree_still_raises(self):
+        with self.assertRaises(ValueError):
+            ParentNode("div", []).to_html(cache=RenderCache(min_length=0))
+
+    def test_nested_empty_parent_raises_value_error(self):
+        document = ParentNode("div", [ParentNode("p", [LeafNode(None, "x")]), ParentNode("p", [])])
+        with self.assertRaises(ValueError):
+            document.to_html(cache=RenderCache(min_length=0))
+
+    def test_nested_parent_without_children_raises_value_error(self):
+        document = ParentNode("div", [ParentNode("p", [LeafNode(None, "x")]), ParentNode("p", None)])
+        with self.assertRaises(ValueError):
+            document.to_html(cache=RenderCache(min_length=0))
+
+    def test_props_changed_in_place_are_not_stale(self):
+        cache = RenderCache(min_length=0)
+        link = LeafNode("a", "link", {"href": "/old"})
+        document = ParentNode("div", [ParentNode("p", [link])])
+        document.to_html(cache=cache)
+
+        link.props["href"] = "/new"
+        self.assertEqual(document.to_html(cache=cache), '<div><p><a href="/new">link</a></p></div>')
+
+    def test_minified_and_full_output_are_cached_apart(self):
+        cache = RenderCache(min_length=0)
+        document = ParentNode("div", [LeafNode(None, "\n"), ParentNode("p", [LeafNode(None, "a   b")])])
+
+        self.assertEqual(document.to_html(cache=cache), document.to_html())
+        self.assertEqual(document.to_html(cache=cache, minify=True), document.to_html(minify=True))
+        self.assertEqual(document.to_html(cache=cache), "<div>\n<p>a   b</p></div>")
+
+    def test_subtree_under_pre_is_cached_apart(self):
+        cache = RenderCache(min_length=0)
+        span = ParentNode("span", [LeafNode(None, "a   b")])
+        document = ParentNode("div", [ParentNode("p", [span]), ParentNode("pre", [ParentNode("span", [LeafNode(None, "a   b")])])])
+
+        self.assertEqual(document.to_html(cache=cache, minify=True), document.to_html(minify=True))
+
+    def test_colliding_hashes_do_not_share_html(self):
+        cache = RenderCache(min_length=0)
+        first = ParentNode("p", [LeafNode(None, CollidingText("first"))])
+        second = ParentNode("p", [LeafNode(None, CollidingText("second"))])
+
+        self.assertEqual(first.to_html(cache=cache), "<p>first</p>")
+        self.assertEqual(second.to_html(cache=cache), "<p>second</p>")
+        self.assertEqual(second.to_html(cache=cache), "<p>second</p>")
+        self.assertEqual((len(cache), cache.hits), (2, 1))
+
+    def test_rejects_non_positive_size(self):
+        with self.assertRaises(ValueError):
+            RenderCache(maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,308 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import main
+
+from site_builder import (
+    MANIFEST_NAME,
+    PAGE_POOL_THRESHOLD,
+    build_site,
+    extract_title,
+    find_pages,
+    listed_directories,
+    render_page,
+)
+
+
+TEMPLATE = "<title>{{ Title }}</title><main>{{ Content }}</main>"
+
+
+class TestExtractTitle(unittest.TestCase):
+    def test_first_h1(self):
+        self.assertEqual(extract_title("intro\n\n#  Hello  \n\n# Second"), "Hello")
+
+    def test_h2_is_not_a_title(self):
+        with self.assertRaises(ValueError):
+            extract_title("## Not a title\n\ntext")
+
+
+class TestRenderPage(unittest.TestCase):
+    def test_fills_template(self):
+        html = render_page("# Hi\n\nSome **text**", TEMPLATE)
+        self.assertEqual(html, "<title>Hi</title><main><div><h1>Hi</h1><p>Some <b>text</b></p></div></main>")
+
+    def test_title_is_escaped(self):
+        html = render_page("# A <b> & c", TEMPLATE)
+        self.assertTrue(html.startswith("<title>A &lt;b&gt; &amp; c</title>"))
+
+    def test_fills_listing(self):
+        md = "# Blog\n\n{{ list: posts/ }}"
+        html = render_page(md, TEMPLATE, {"posts": [("First", "/posts/a.html"), ("Second", "/posts/b.html")]})
+        self.assertIn('<ul><li><a href="/posts/a.html">First</a></li><li><a href="/posts/b.html">Second</a></li></ul>', html)
+
+    def test_listing_titles_are_not_markdown(self):
+        md = "# Blog\n\n{{ list: posts }}"
+        html = render_page(md, TEMPLATE, {"posts": [("Arrays [part 1] & <more>", "/posts/a.html")]})
+        self.assertIn('<li><a href="/posts/a.html">Arrays [part 1] &amp; &lt;more&gt;</a></li>', html)
+
+    def test_directive_in_fence_is_left_alone(self):
+        md = "# Blog\n\n```\n{{ list: posts }}\n```"
+        html = render_page(md, TEMPLATE, {"posts": [("First", "/posts/a.html")]})
+        self.assertIn("<pre><code>{{ list: posts }}\n</code></pre>", html)
+        self.assertNotIn("<ul>", html)
+        self.assertEqual(listed_directories(md), [])
+
+    def test_listed_directories(self):
+        self.assertEqual(listed_directories("# A\n\n{{ list: b }}\n\n{{ list: . }}\n\n{{ list: a/ }}"), ["", "a", "b"])
+
+
+class SiteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp.name, "content")
+        self.dest = os.path.join(self.tmp.name, "public")
+        self.template = os.path.join(self.tmp.name, "template.html")
+        with open(self.template, "w") as f:
+            f.write(TEMPLATE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, relative, text):
+        path = os.path.join(self.content, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def read(self, relative):
+        with open(os.path.join(self.dest, relative)) as f:
+            return f.read()
+
+
+class TestBuildSite(SiteTestCase):
+    def test_keeps_directory_layout(self):
+        self.write("index.md", "# Home")
+        self.write("blog/post.md", "# Post\n\ntext")
+        self.write("blog/image.png", "not markdown")
+
+        pages = build_site(self.content, self.template, self.dest, jobs=1).built
+
+        self.assertEqual(pages, [os.path.join(self.dest, "index.html"), os.path.join(self.dest, "blog", "post.html")])
+        self.assertEqual(self.read("index.html"), "<title>Home</title><main><div><h1>Home</h1></div></main>")
+        self.assertIn("<p>text</p>", self.read("blog/post.html"))
+        self.assertFalse(os.path.exists(os.path.join(self.dest, "blog", "image.png")))
+
+    def test_process_pool_matches_serial_build(self):
+        count = PAGE_POOL_THRESHOLD + 4
+        for i in range(count):
+            self.write(f"section{i % 3}/page{i}.md", f"# Page {i}\n\n- item _{i}_")
+
+        pages = build_site(self.content, self.template, self.dest, jobs=2).built
+        parallel = {page: self.read(os.path.relpath(page, self.dest)) for page in pages}
+
+        serial_pages = build_site(self.content, self.template, self.dest, jobs=1, force=True).built
+
+        self.assertEqual(pages, serial_pages)
+        self.assertEqual(len(pages), count)
+        for page in pages:
+            self.assertEqual(parallel[page], self.read(os.path.relpath(page, self.dest)))
+
+    def test_find_pages_is_sorted(self):
+        self.write("b.md", "# B")
+        self.write("a/z.md", "# Z")
+        self.write("a.md", "# A")
+
+        sources = [os.path.relpath(src, self.content) for src, _ in find_pages(self.content, self.dest)]
+        self.assertEqual(sources, ["a.md", "b.md", os.path.join("a", "z.md")])
+
+
+class TestIncrementalBuild(SiteTestCase):
+    def build(self, **kwargs):
+        return build_site(self.content, self.template, self.dest, jobs=1, **kwargs)
+
+    def test_unchanged_site_is_skipped(self):
+        self.write("a.md", "# A")
+        self.write("b.md", "# B")
+        self.build()
+
+        report = self.build()
+        self.assertEqual(report.built, [])
+        self.assertEqual(len(report.skipped), 2)
+        self.assertEqual(report.removed, [])
+
+    def test_only_changed_page_is_rebuilt(self):
+        path = self.write("a.md", "# A")
+        self.write("b.md", "# B")
+        self.build()
+
+        self.write("a.md", "# A2")
+        os.utime(path, ns=(0, 10**9))
+        report = self.build()
+
+        self.assertEqual(report.built, [os.path.join(self.dest, "a.html")])
+        self.assertIn("<h1>A2</h1>", self.read("a.html"))
+
+    def test_touched_but_unchanged_page_is_skipped(self):
+        path = self.write("a.md", "# A")
+        self.build()
+
+        os.utime(path, ns=(0, 10**9))
+        report = self.build()
+        self.assertEqual(report.built, [])
+
+    def test_template_change_rebuilds_everything(self):
+        self.write("a.md", "# A")
+        self.write("b.md", "# B")
+        self.build()
+
+        with open(self.template, "w") as f:
+            f.write("<h1>{{ Title }}</h1>{{ Content }}")
+        report = self.build()
+
+        self.assertEqual(len(report.built), 2)
+        self.assertTrue(self.read("a.html").startswith("<h1>A</h1>"))
+
+    def test_removed_source_deletes_output(self):
+        self.write("a.md", "# A")
+        path = self.write("old/b.md", "# B")
+        self.build()
+
+        os.remove(path)
+        report = self.build()
+
+        self.assertEqual(report.removed, [os.path.join(self.dest, "old", "b.html")])
+        self.assertFalse(os.path.exists(os.path.join(self.dest, "old", "b.html")))
+
+    def test_missing_output_is_rebuilt(self):
+        self.write("a.md", "# A")
+        self.build()
+
+        os.remove(os.path.join(self.dest, "a.html"))
+        self.assertEqual(len(self.build().built), 1)
+
+    def test_corrupt_manifest_rebuilds(self):
+        self.write("a.md", "# A")
+        self.build()
+
+        with open(os.path.join(self.dest, MANIFEST_NAME), "w") as f:
+            f.write("{not json")
+        self.assertEqual(len(self.build().built), 1)
+
+    def test_force_rebuilds_everything(self):
+        self.write("a.md", "# A")
+        self.build()
+        self.assertEqual(len(self.build(force=True).built), 1)
+
+    def test_force_still_deletes_removed_outputs(self):
+        self.write("a.md", "# A")
+        path = self.write("b.md", "# B")
+        self.build()
+
+        os.remove(path)
+        report = self.build(force=True)
+
+        self.assertEqual(report.removed, [os.path.join(self.dest, "b.html")])
+        self.assertFalse(os.path.exists(os.path.join(self.dest, "b.html")))
+
+
+class TestDependencyGraph(SiteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.partials = os.path.join(self.tmp.name, "partials")
+        os.makedirs(self.partials)
+        self.write_partial("nav", "<nav></nav>")
+        with open(self.template, "w") as f:
+            f.write("{{> nav }}" + TEMPLATE)
+
+        self.write("index.md", "# Home\n\n{{ list: blog }}")
+        self.write("about.md", "# About")
+        self.write("blog/first.md", "# First post\n\nbody")
+        self.write("blog/second.md", "# Second post\n\nbody")
+        self.build()
+
+    def write_partial(self, name, text):
+        path = os.path.join(self.partials, name + ".html")
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def build(self, **kwargs):
+        return build_site(self.content, self.template, self.dest, jobs=1, **kwargs)
+
+    def rebuilt(self, report):
+        return {os.path.relpath(page, self.dest): why for page, why in report.reasons.items()}
+
+    def edit(self, relative, text):
+        path = self.write(relative, text)
+        os.utime(path, ns=(0, 10**9))
+
+    def test_listing_is_rendered(self):
+        self.assertIn('<li><a href="/blog/first.html">First post</a></li>', self.read("index.html"))
+
+    def test_body_change_rebuilds_only_that_page(self):
+        self.edit("blog/first.md", "# First post\n\nnew body")
+        self.assertEqual(self.rebuilt(self.build()), {os.path.join("blog", "first.html"): ["source changed"]})
+
+    def test_title_change_rebuilds_listing(self):
+        self.edit("blog/first.md", "# Renamed post\n\nbody")
+        key = os.path.join("blog", "first.md")
+
+        self.assertEqual(
+            self.rebuilt(self.build()),
+            {
+                os.path.join("blog", "first.html"): ["source changed"],
+                "index.html": [f"listed page {key} retitled"],
+            },
+        )
+        self.assertIn(">Renamed post</a>", self.read("index.html"))
+
+    def test_added_and_removed_pages_rebuild_listing(self):
+        self.write("blog/third.md", "# Third post")
+        os.remove(os.path.join(self.content, "blog", "second.md"))
+
+        report = self.build()
+        self.assertEqual(
+            self.rebuilt(report)["index.html"],
+            [f"listed page {os.path.join('blog', 'second.md')} removed", f"listed page {os.path.join('blog', 'third.md')} added"],
+        )
+        self.assertEqual(report.removed, [os.path.join(self.dest, "blog", "second.html")])
+        self.assertNotIn("Second post", self.read("index.html"))
+
+    def test_page_outside_listed_directory_does_not_rebuild_listing(self):
+        self.write("contact.md", "# Contact")
+        self.assertEqual(self.rebuilt(self.build()), {"contact.html": ["new page"]})
+
+    def test_partial_change_rebuilds_every_page(self):
+        path = self.write_partial("nav", "<nav>new</nav>")
+        rebuilt = self.rebuilt(self.build())
+
+        self.assertEqual(len(rebuilt), 4)
+        self.assertEqual(rebuilt["about.html"], [f"{path} changed"])
+        self.assertTrue(self.read("about.html").startswith("<nav>new</nav>"))
+
+    def test_unused_partial_does_not_rebuild(self):
+        self.write_partial("unused", "<aside></aside>")
+        self.assertEqual(self.rebuilt(self.build()), {})
+
+    def test_missing_output_and_force_reasons(self):
+        os.remove(os.path.join(self.dest, "about.html"))
+        self.assertEqual(self.rebuilt(self.build()), {"about.html": ["output missing"]})
+        self.assertEqual(self.rebuilt(self.build(force=True))["index.html"], ["forced"])
+
+    def test_explain_prints_reasons(self):
+        self.edit("about.md", "# About us")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            main.main(
+                ["build", "--content", self.content, "--template", self.template, "--dest", self.dest, "--jobs", "1", "--explain"]
+            )
+
+        self.assertIn(f"{os.path.join(self.dest, 'about.html')}: source changed", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from templates import CompiledTemplate, compile_template, content_hash, load_template
+
+
+class TemplateTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.template = self.path("template.html")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, relative):
+        return os.path.join(self.tmp.name, relative)
+
+    def write(self, relative, text):
+        path = self.path(relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+
+class TestLoadTemplate(TemplateTestCase):
+    def test_template_without_partials(self):
+        self.write("template.html", "<title>{{ Title }}</title>")
+        text, dependencies = load_template(self.template)
+
+        self.assertEqual(text, "<title>{{ Title }}</title>")
+        self.assertEqual(dependencies, {self.template: content_hash(b"<title>{{ Title }}</title>")})
+
+    def test_partials_are_filled_in(self):
+        self.write("template.html", "{{> header }}<main>{{ Content }}</main>{{>footer}}")
+        header = self.write("partials/header.html", "<header>{{> nav/links }}</header>")
+        links = self.write("partials/nav/links.html", "<a>home</a>")
+        footer = self.write("partials/footer.html", "<footer></footer>")
+
+        text, dependencies = load_template(self.template)
+
+        self.assertEqual(text, "<header><a>home</a></header><main>{{ Content }}</main><footer></footer>")
+        self.assertEqual(list(dependencies), [self.template, header, links, footer])
+
+    def test_unknown_partial(self):
+        self.write("template.html", "{{> missing }}")
+        with self.assertRaises(ValueError):
+            load_template(self.template)
+
+    def test_partial_cycle(self):
+        self.write("template.html", "{{> a }}")
+        self.write("partials/a.html", "{{> b }}")
+        self.write("partials/b.html", "{{> a }}")
+        with self.assertRaises(ValueError):
+            load_template(self.template)
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    def test_segments(self):
+        template = CompiledTemplate("<title>{{ Title }}</title><h1>{{Title}}</h1>{{ Content }}")
+        self.assertEqual(template.parts, ["<title>", "{{ Title }}", "</title><h1>", "{{Title}}", "</h1>", "{{ Content }}"])
+        self.assertEqual(template.slots, {"Title": [1, 3], "Content": [5]})
+
+    def test_render(self):
+        template = CompiledTemplate("<title>{{ Title }}</title><h1>{{ Title }}</h1>{{ Content }}!")
+        self.assertEqual(
+            template.render({"Title": "Hi", "Content": "<p>x</p>"}),
+            "<title>Hi</title><h1>Hi</h1><p>x</p>!",
+        )
+
+    def test_render_keeps_unknown_slots(self):
+        template = CompiledTemplate("{{ Title }} {{ Other }}")
+        self.assertEqual(template.render({"Title": "Hi"}), "Hi {{ Other }}")
+
+    def test_render_does_not_touch_the_template(self):
+        template = CompiledTemplate("[{{ Content }}]")
+        template.render({"Content": "a"})
+        self.assertEqual(template.render({"Content": "b"}), "[b]")
+
+    def test_values_are_not_scanned_for_slots(self):
+        template = CompiledTemplate("{{ Content }}|{{ Title }}")
+        self.assertEqual(template.render({"Content": "{{ Title }}", "Title": "T"}), "{{ Title }}|T")
+
+
+class TestCompileTemplate(TemplateTestCase):
+    def test_reused_until_modified(self):
+        self.write("template.html", "{{> nav }}{{ Content }}")
+        nav = self.write("partials/nav.html", "<nav></nav>")
+
+        first, _ = compile_template(self.template)
+        self.assertIs(compile_template(self.template)[0], first)
+
+        with open(nav, "w") as f:
+            f.write("<nav>changed</nav>")
+        os.utime(nav, ns=(0, 10**9))
+
+        second, dependencies = compile_template(self.template)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.render({"Content": "x"}), "<nav>changed</nav>x")
+        self.assertEqual(dependencies[nav], content_hash(b"<nav>changed</nav>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,15 @@ import unittest
 # Assuming the function will be in a file named `markdown_to_textnode.py`
 # along with your TextNode/TextType definitions.
 from textnode import TextNode, TextType
-from markdown_to_textnode import text_to_textnodes
+from markdown_to_textnode import (
+    text_to_textnodes,
+    cached_text_to_textnodes,
+    set_inline_cache_size,
+    inline_cache_info,
+    clear_inline_cache,
+    text_to_textnodes_batch,
+    INLINE_CACHE_SIZE,
+)
 
 
 class TestTextToTextNodes(unittest.TestCase):
@@ -148,6 +156,18 @@ class TestTextToTextNodes(unittest.TestCase):
         # from invalid markdown, but instead treats it as plain text.
         self.assertListEqual(result, expected)
 
+    def test_stray_delimiter_keeps_other_spans(self):
+        text = "Set _private or my_var with **care** and `code`."
+        result = text_to_textnodes(text)
+        expected = [
+            TextNode("Set _private or my_var with ", TextType.TEXT),
+            TextNode("care", TextType.BOLD),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("code", TextType.CODE),
+            TextNode(".", TextType.TEXT),
+        ]
+        self.assertListEqual(result, expected)
+
     def test_empty_input_string(self):
         text = ""
         result = text_to_textnodes(text)
@@ -170,5 +190,76 @@ class TestTextToTextNodes(unittest.TestCase):
         self.assertListEqual(result, expected)
 
 
+class TestCachedTextToTextNodes(unittest.TestCase):
+    def setUp(self):
+        set_inline_cache_size(2)
+
+    def tearDown(self):
+        set_inline_cache_size(INLINE_CACHE_SIZE)
+
+    def test_returns_immutable_sequence(self):
+        result = cached_text_to_textnodes("Edit **this** page")
+        self.assertIsInstance(result, tuple)
+        self.assertListEqual(list(result), text_to_textnodes("Edit **this** page"))
+
+    def test_nodes_are_frozen(self):
+        result = cached_text_to_textnodes("**bold _nested_ text**")
+        self.assertEqual(result, tuple(node.freeze() for node in text_to_textnodes("**bold _nested_ text**")))
+        self.assertListEqual(text_to_textnodes("**bold _nested_ text**"), list(result))
+        self.assertIsInstance(result[0].children, tuple)
+
+        with self.assertRaises(AttributeError):
+            result[0].text = "changed"
+        self.assertEqual(cached_text_to_textnodes("**bold _nested_ text**")[0].text, "bold nested text")
+
+    def test_counts_hits_and_misses(self):
+        first = cached_text_to_textnodes("License: _MIT_")
+        second = cached_text_to_textnodes("License: _MIT_")
+
+        self.assertIs(first, second)
+        info = inline_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+
+    def test_evicts_least_recently_used(self):
+        cached_text_to_textnodes("a")
+        cached_text_to_textnodes("b")
+        cached_text_to_textnodes("a")
+        cached_text_to_textnodes("c")
+        cached_text_to_textnodes("a")
+        cached_text_to_textnodes("b")
+
+        info = inline_cache_info()
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+
+    def test_clear_resets_counters(self):
+        cached_text_to_textnodes("a")
+        clear_inline_cache()
+
+        info = inline_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+class TestTextToTextNodesBatch(unittest.TestCase):
+    TEXTS = [
+        "- list item with **bold**",
+        "plain",
+        "",
+        "a [link](x.com) and `code`",
+    ] * 5
+
+    def test_serial_batch_matches_single_calls(self):
+        result = list(text_to_textnodes_batch(self.TEXTS))
+        expected = [text_to_textnodes(text) for text in self.TEXTS]
+        self.assertListEqual(result, expected)
+
+    def test_accepts_generators(self):
+        result = list(text_to_textnodes_batch(text for text in self.TEXTS))
+        self.assertEqual(len(result), len(self.TEXTS))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,11 @@ class TestTextNode(unittest.TestCase):
         node2 = TextNode("This is a text node", TextType.BOLD)
         self.assertEqual(node, node2)
 
+    def test_nested_node_equals_its_frozen_form(self):
+        node = TextNode("bold italic", TextType.BOLD, None, [TextNode("bold ", TextType.TEXT), TextNode("italic", TextType.ITALIC)])
+        self.assertEqual(node, node.freeze())
+        self.assertEqual(node.freeze(), node)
+
     def test_repr(self):
         node = TextNode("This is dummy text", TextType.LINK, "http://www.google.com")
         self.assertTrue(repr(node).startswith("TextNode("))
@@ -85,6 +90,20 @@ class TestTextNode(unittest.TestCase):
         self.assertEqual(node.text, "print('hello')")
         self.assertEqual(node.text_type, TextType.CODE)
 
+    def test_eq_compares_children(self):
+        child = TextNode("inner", TextType.ITALIC)
+        node = TextNode("inner", TextType.BOLD, None, [child])
+        node2 = TextNode("inner", TextType.BOLD)
+        self.assertNotEqual(node, node2)
+        self.assertEqual(node, TextNode("inner", TextType.BOLD, None, [child]))
+
+    def test_slotted_without_instance_dict(self):
+        node = TextNode("Test text", TextType.BOLD)
+        self.assertFalse(hasattr(node, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            node.extra = "not allowed"
+
 
 if __name__ == "__main__":
     unittest.main()
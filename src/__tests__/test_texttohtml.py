@@ -2,7 +2,7 @@ import unittest
 
 from textnode import TextNode, TextType
 from leafnode import LeafNode
-from text_to_html import text_to_html
+from text_to_html import text_to_html, textnodes_to_html, render_textnodes_into
 
 
 class TestTextToHtml(unittest.TestCase):
@@ -235,6 +235,71 @@ class TestTextToHtml(unittest.TestCase):
             result = text_to_html(node)
             self.assertIsInstance(result, LeafNode)
 
+    def test_nested_children_render_as_parent(self):
+        node = TextNode(
+            "bold italic",
+            TextType.BOLD,
+            None,
+            [TextNode("bold ", TextType.TEXT), TextNode("italic", TextType.ITALIC)],
+        )
+
+        result = text_to_html(node)
+        self.assertEqual(result.to_html(), "<b>bold <i>italic</i></b>")
+
+
+class TestTextNodesToHtml(unittest.TestCase):
+    NODES = [
+        TextNode("Plain ", TextType.TEXT),
+        TextNode("bold", TextType.BOLD),
+        TextNode("italic", TextType.ITALIC),
+        TextNode("code()", TextType.CODE),
+        TextNode("link", TextType.LINK, "https://example.com"),
+        TextNode("alt text", TextType.IMAGE, "img.png"),
+        TextNode(
+            "outer inner",
+            TextType.BOLD,
+            None,
+            [TextNode("outer ", TextType.TEXT), TextNode("inner", TextType.ITALIC)],
+        ),
+    ]
+
+    def test_matches_leafnode_path(self):
+        expected = "".join(text_to_html(node).to_html() for node in self.NODES)
+        self.assertEqual(textnodes_to_html(self.NODES), expected)
+
+    def test_render_into_existing_buffer(self):
+        buffer = ["<p>"]
+        render_textnodes_into([TextNode("x", TextType.CODE)], buffer)
+        buffer.append("</p>")
+        self.assertEqual("".join(buffer), "<p><code>x</code></p>")
+
+    def test_link_without_url_raises(self):
+        with self.assertRaises(ValueError) as context:
+            textnodes_to_html([TextNode("Link", TextType.LINK, " ")])
+
+        self.assertEqual(str(context.exception), "Link node must have a URL")
+
+    def test_text_and_attributes_are_escaped(self):
+        nodes = [
+            TextNode("1 < 2 & 3", TextType.CODE),
+            TextNode("a \"quoted\" link", TextType.LINK, "/search?a=1&b=2"),
+            TextNode('alt "text"', TextType.IMAGE, "img.png"),
+        ]
+        self.assertEqual(
+            textnodes_to_html(nodes),
+            "<code>1 &lt; 2 &amp; 3</code>"
+            '<a href="/search?a=1&amp;b=2">a "quoted" link</a>'
+            '<img src="img.png" alt="alt &quot;text&quot;">',
+        )
+
+    def test_deeply_nested_spans(self):
+        node = TextNode("x", TextType.TEXT)
+        for _ in range(20000):
+            node = TextNode("x", TextType.ITALIC, None, [node])
+
+        result = textnodes_to_html([node])
+        self.assertEqual(result, "<i>" * 20000 + "x" + "</i>" * 20000)
+
 
 if __name__ == "__main__":
     unittest.main()
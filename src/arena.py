@@ -0,0 +1,192 @@
+from array import array
+
+from html_escape import escape_text
+from htmlnode import OPEN_TAGS, CLOSE_TAGS
+from leafnode import LeafNode, VOID_TAGS
+from parentnode import ParentNode
+
+
+MISSING = -1
+
+# id 0 of every string table, so a missing tag or value needs no branch
+NO_STRING = 0
+
+
+class ArenaDocument:
+    # a document stored as parallel arrays in pre-order instead of one object
+    # per node. tags and values are ids into a table where every distinct
+    # string is kept once, and the tree is linked by first_child and
+    # next_sibling indices. a node with a first child is a parent node.
+    __slots__ = (
+        "strings",
+        "tags",
+        "values",
+        "first_child",
+        "next_sibling",
+        "props",
+        "open_tags",
+        "props_ids",
+    )
+
+    def __init__(self):
+        self.strings = [None]
+        self.tags = array("i")
+        self.values = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.props = []
+        self.open_tags = []
+        self.props_ids = array("i")
+
+    def __len__(self):
+        return len(self.tags)
+
+    @classmethod
+    def from_node(cls, root):
+        document = cls()
+        first_child = document.first_child
+        next_sibling = document.next_sibling
+        last_child = array("i")
+        # only needed while building, so it is not kept on the document
+        string_ids = {None: NO_STRING}
+
+        stack = [(root, MISSING)]
+        while stack:
+            node, parent = stack.pop()
+            index = document._add(node, string_ids)
+            last_child.append(MISSING)
+
+            if parent != MISSING:
+                if first_child[parent] == MISSING:
+                    first_child[parent] = index
+                else:
+                    next_sibling[last_child[parent]] = index
+                last_child[parent] = index
+
+            if isinstance(node, ParentNode):
+                # pushed in reverse so the first child is taken next
+                for child in reversed(node.children):
+                    stack.append((child, index))
+
+        return document
+
+    def _add(self, node, string_ids):
+        if isinstance(node, ParentNode):
+            if not node.tag:
+                raise ValueError("Parent node must have a tag")
+            if not node.children:
+                raise ValueError("Parent node must have children nodes")
+        elif isinstance(node, LeafNode):
+            if not node.value and node.tag not in VOID_TAGS:
+                raise ValueError("Leaf Node must have a value")
+        else:
+            raise ValueError(f"Unsupported node type: {type(node).__name__}")
+
+        self.tags.append(self._string_id(node.tag, string_ids))
+        self.values.append(self._string_id(node.value, string_ids))
+        self.first_child.append(MISSING)
+        self.next_sibling.append(MISSING)
+
+        if node.props:
+            self.props_ids.append(len(self.props))
+            self.props.append(dict(node.props))
+            self.open_tags.append(f"<{node.tag} {node.props_to_html()}>")
+        else:
+            self.props_ids.append(MISSING)
+
+        return len(self.tags) - 1
+
+    def _string_id(self, value, string_ids):
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def to_node(self):
+        if not self.tags:
+            raise ValueError("Arena document is empty")
+
+        strings = self.strings
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        nodes = [None] * len(self.tags)
+
+        # children always come after their parent, so walking backwards
+        # finds every child already built
+        for index in range(len(self.tags) - 1, -1, -1):
+            tag = strings[self.tags[index]]
+            props_id = self.props_ids[index]
+            props = dict(self.props[props_id]) if props_id != MISSING else None
+
+            child = first_child[index]
+            if child == MISSING:
+                nodes[index] = LeafNode(tag, strings[self.values[index]], props)
+                continue
+
+            children = []
+            while child != MISSING:
+                children.append(nodes[child])
+                nodes[child] = None
+                child = next_sibling[child]
+            nodes[index] = ParentNode(tag, children, props)
+
+        return nodes[0]
+
+    def to_html(self):
+        return "".join(self._fragments())
+
+    def write_html(self, out):
+        out.writelines(self._fragments())
+
+    def _fragments(self):
+        # one pass over the arrays in order; the indices of the open parents
+        # are kept on a stack and closed once their last child is written.
+        # the open and close tags are looked up once per distinct tag id, not
+        # once per node, and are collected into a list, which is cheaper than
+        # yielding each fragment.
+        strings = self.strings
+        tags = self.tags
+        values = self.values
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        props_ids = self.props_ids
+        props_tags = self.open_tags
+
+        open_tags = {}
+        close_tags = {}
+        for tag_id in set(tags):
+            tag = strings[tag_id]
+            if tag:
+                open_tags[tag_id] = OPEN_TAGS[tag]
+                close_tags[tag_id] = None if tag in VOID_TAGS else CLOSE_TAGS[tag]
+
+        out = []
+        append = out.append
+        stack = []
+
+        for index in range(len(tags)):
+            tag_id = tags[index]
+            props_id = props_ids[index]
+
+            if first_child[index] != MISSING:
+                append(props_tags[props_id] if props_id != MISSING else open_tags[tag_id])
+                stack.append(index)
+                continue
+
+            if not tag_id:
+                append(escape_text(strings[values[index]]))
+            else:
+                append(props_tags[props_id] if props_id != MISSING else open_tags[tag_id])
+                close_tag = close_tags[tag_id]
+                if close_tag is not None:
+                    append(escape_text(strings[values[index]]))
+                    append(close_tag)
+
+            sibling = next_sibling[index]
+            while sibling == MISSING and stack:
+                node = stack.pop()
+                append(close_tags[tags[node]])
+                sibling = next_sibling[node]
+
+        return out
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from enum import Enum
 
 
@@ -10,65 +11,76 @@ class BlockType(Enum):
     ORDERED_LIST = "ordered_list"
 
 
-def block_to_block_type(block):
-    if is_code(block):
-        return BlockType.CODE
+# lines is the block split on "\n"; level is the heading depth, else None
+BlockInfo = namedtuple("BlockInfo", ["block_type", "lines", "level"])
 
-    first_line = block.split("\n", 1)[0]
 
-    if is_unordered_list(first_line):
-        for line in block.split("\n"):
-            if not is_unordered_list(line):
-                return BlockType.PARAGRAPH
+def block_to_block_type(block):
+    return classify_block(block).block_type
 
-        return BlockType.UNORDERED_LIST
 
-    if is_ordered_list(first_line, 1):
-        i = 0
-        for line in block.split("\n"):
-            i += 1
-            if not is_ordered_list(line, i):
-                return BlockType.PARAGRAPH
+def classify_block(block):
+    return classify_lines(block.split("\n"))
 
-        return BlockType.ORDERED_LIST
 
-    if is_heading(first_line):
-        return BlockType.HEADING
+def classify_lines(lines):
+    # lines of an already stripped block, first and last line non-blank
+    first_line = lines[0]
+    first = first_line[:1]
 
-    if is_quote(first_line):
-        for line in block.split("\n"):
-            if not is_quote(line):
-                return BlockType.PARAGRAPH
+    if first == "`":
+        if first_line.startswith("```") and lines[-1].endswith("```"):
+            return BlockInfo(BlockType.CODE, lines, None)
 
-        return BlockType.QUOTE
+    elif first == "-":
+        for line in lines:
+            if not line.startswith("- "):
+                return BlockInfo(BlockType.PARAGRAPH, lines, None)
 
-    return BlockType.PARAGRAPH
+        return BlockInfo(BlockType.UNORDERED_LIST, lines, None)
 
+    elif first == "1":
+        number = 0
+        for line in lines:
+            number += 1
+            prefix = str(number)
+            if not (line.startswith(prefix) and line.startswith(". ", len(prefix))):
+                return BlockInfo(BlockType.PARAGRAPH, lines, None)
 
-def is_unordered_list(line):
-    return line.startswith("- ")
+        return BlockInfo(BlockType.ORDERED_LIST, lines, None)
 
+    elif first == "#":
+        head = first_line[:7]
+        level = len(head) - len(head.lstrip("#"))
+        if level <= 6 and first_line.startswith(" ", level):
+            return BlockInfo(BlockType.HEADING, lines, level)
 
-def is_ordered_list(line, number):
-    return line.startswith(f"{number}. ")
+    elif first == ">":
+        for line in lines:
+            if not line.startswith("> "):
+                return BlockInfo(BlockType.PARAGRAPH, lines, None)
 
+        return BlockInfo(BlockType.QUOTE, lines, None)
 
-def is_code(text):
-    return text.startswith("```") and text.endswith("```")
+    return BlockInfo(BlockType.PARAGRAPH, lines, None)
 
 
-def is_quote(line):
-    return line.startswith("> ")
+def code_block_text(lines):
+    # the content between the fences of a code block, without inline parsing
+    if len(lines) == 1:
+        return lines[0][3:-3]
 
+    # text before a closing fence on the last line is part of the code
+    body = lines[1:-1]
+    last = lines[-1][:-3]
+    if last.strip():
+        body.append(last)
 
-def is_heading(line):
-    valid_starts = ["# ", "## ", "### ", "#### ", "##### ", "###### "]
+    if not body:
+        return ""
 
-    for item in valid_starts:
-        if line.startswith(item):
-            return True
+    return "\n".join(body) + "\n"
 
-    return False
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+from block_parser import BlockType, code_block_text
+from leafnode import LeafNode
+from md_to_block import scan_blocks
+from markdown_to_textnode import cached_text_to_textnodes
+from parentnode import ParentNode
+from text_to_html import text_to_html
+
+
+def markdown_to_html_node(md):
+    # a parent needs children, so an empty document gets a blank line
+    return ParentNode("div", lines_to_html_nodes(md.split("\n")) or [LeafNode(None, "\n")])
+
+
+def lines_to_html_nodes(lines):
+    # one pass over the blocks: each is split into lines and classified once
+    # by scan_blocks, and the converters below work on those lines
+    children = []
+
+    for block_type, lines, level in scan_blocks(lines):
+        if block_type is BlockType.PARAGRAPH:
+            node = ParentNode("p", text_to_children(" ".join(lines)))
+        elif block_type is BlockType.HEADING:
+            node = ParentNode(f"h{level}", text_to_children(" ".join(lines)[level + 1 :]))
+        elif block_type is BlockType.CODE:
+            node = code_block_to_html_node(lines)
+        elif block_type is BlockType.QUOTE:
+            node = quote_block_to_html_node(lines)
+        elif block_type is BlockType.UNORDERED_LIST:
+            node = list_block_to_html_node("ul", [line[2:] for line in lines])
+        else:
+            node = list_block_to_html_node("ol", [line[line.index(". ") + 2 :] for line in lines])
+
+        children.append(node)
+
+    return children
+
+
+def text_to_children(text):
+    # an empty list item has no inline nodes; it renders as blank text, the
+    # way an empty code block does
+    children = [text_to_html(text_node) for text_node in cached_text_to_textnodes(text)]
+    return children or [LeafNode(None, "\n")]
+
+
+def code_block_to_html_node(lines):
+    # code is emitted verbatim: no inline parsing, no TextNodes
+    text = code_block_text(lines)
+
+    # a leaf needs a value, and an empty block renders the same with a newline
+    return ParentNode("pre", [LeafNode("code", text or "\n")])
+
+
+def quote_block_to_html_node(lines):
+    # every line starts with "> ", which the classifier already checked
+    return ParentNode("blockquote", text_to_children(" ".join(line[2:] for line in lines)))
+
+
+def list_block_to_html_node(tag, items):
+    return ParentNode(tag, [ParentNode("li", text_to_children(item)) for item in items])
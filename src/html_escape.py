@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+
+ATTRIBUTE_CACHE_SIZE = 4096
+
+
+def escape_text(text):
+    # most prose has nothing to escape, and then no copy is made at all
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def escape_attribute(value):
+    # hrefs and srcs repeat across a site, so their escaped form is memoized
+    value = str(value)
+    if "&" not in value and "<" not in value and ">" not in value and '"' not in value:
+        return value
+
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
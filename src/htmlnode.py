@@ -1,21 +1,206 @@
+import re
+import sys
+
+from html_escape import escape_attribute
+
+
+class _TagTable(dict):
+    # builds and interns the tag string the first time a tag name is seen
+    def __init__(self, template):
+        super().__init__()
+        self.template = template
+
+    def __missing__(self, tag):
+        value = self[tag] = sys.intern(self.template.format(tag))
+        return value
+
+
+DEFAULT_CHUNK_SIZE = 16384
+
+OPEN_TAGS = _TagTable("<{}>")
+CLOSE_TAGS = _TagTable("</{}>")
+
+# whitespace inside these is content and is never collapsed
+PREFORMATTED_TAGS = frozenset(["pre", "code", "textarea", "script", "style"])
+
+# whitespace-only text between two of these is not rendered by browsers
+BLOCK_TAGS = frozenset(
+    """address article aside blockquote body dd div dl dt fieldset figcaption
+    figure footer form h1 h2 h3 h4 h5 h6 head header hr html li main nav ol p
+    pre section table tbody td tfoot th thead tr ul""".split()
+)
+
+HTML_WHITESPACE = " \t\n\r\f"
+
+# only runs that would change: two or more characters, or a single one that
+# is not a plain space. non-breaking spaces are left alone.
+_WHITESPACE_RUN = re.compile(r"[ \t\n\r\f]{2,}|[\t\n\r\f]")
+
+
+def collapse_whitespace(text):
+    return _WHITESPACE_RUN.sub(" ", text)
+
+
+def strip_block_whitespace(children):
+    # drops whitespace-only text children that sit between block elements or
+    # between a block element and the edge of the parent
+    kept = []
+    last = len(children) - 1
+
+    for i, child in enumerate(children):
+        value = child.value
+        if child.tag is None and type(value) is str and value and not value.strip(HTML_WHITESPACE):
+            if (i == 0 or children[i - 1].tag in BLOCK_TAGS) and (
+                i == last or children[i + 1].tag in BLOCK_TAGS
+            ):
+                continue
+
+        kept.append(child)
+
+    return kept
+
+
+def subtree_hashes(root):
+    # structural hash of root and of every node below it that has a children
+    # list, even an empty one, keyed by id(node). parents are collected in pre-order and hashed in
+    # reverse, so the hashes of a node's children are always ready first.
+    # leaves are hashed in place and never stored, since only subtrees are
+    # worth looking up.
+    parents = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.children is not None:
+            parents.append(node)
+            stack.extend([child for child in node.children if child.children is not None])
+
+    if not parents:
+        return {id(root): _leaf_hash(root)}
+
+    hashes = {}
+    for node in reversed(parents):
+        # the leaf hash is written out inline; this loop runs once per node
+        child_hashes = tuple(
+            [
+                hashes[id(child)]
+                if child.children is not None
+                else hash(
+                    (
+                        type(child),
+                        child.tag,
+                        child.value,
+                        tuple(child.props.items()) if child.props else None,
+                    )
+                )
+                for child in node.children
+            ]
+        )
+        props = tuple(node.props.items()) if node.props else None
+        hashes[id(node)] = hash((type(node), node.tag, props, child_hashes))
+
+    return hashes
+
+
+def _leaf_hash(node):
+    props = tuple(node.props.items()) if node.props else None
+    return hash((type(node), node.tag, node.value, props))
+
+
 class HTMLNode:
+    # a full site build keeps millions of nodes alive, so no per-instance dict
+    __slots__ = ("tag", "value", "children", "props", "_props_cache")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
         self.children = children
         self.props = props
+        self._props_cache = None
+
+    # minify drops whitespace-only text between block elements and collapses
+    # whitespace runs in text outside PREFORMATTED_TAGS while rendering
+
+    def to_html(self, cache=None, minify=False):
+        if cache is not None:
+            return cache.render(self, minify)
+
+        return "".join(self._fragments(minify))
+
+    def render_into(self, buffer, minify=False):
+        # appends the pieces of the rendered html to a list
+        buffer.extend(self._fragments(minify))
+
+    def write_html(self, out, minify=False):
+        # writes the rendered html to a text stream piece by piece
+        out.writelines(self._fragments(minify))
+
+    def iter_html(self, chunk_size=DEFAULT_CHUNK_SIZE, minify=False):
+        # yields the html in chunks of exactly chunk_size characters (the
+        # last one may be shorter) while the tree is still being walked, so
+        # a server can send the start of a page before the end is rendered
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        buffer = []
+        size = 0
+
+        for fragment in self._fragments(minify):
+            buffer.append(fragment)
+            size += len(fragment)
+
+            if size >= chunk_size:
+                data = "".join(buffer)
+                end = size - size % chunk_size
+                for start in range(0, end, chunk_size):
+                    yield data[start : start + chunk_size]
+
+                rest = data[end:]
+                buffer = [rest]
+                size = len(rest)
+
+        if size:
+            yield "".join(buffer)
+
+    def _fragments(self, minify=False):
+        yield self._render(minify)
+
+    def _render(self, collapse=False):
+        # the whole html of a node without children, with whitespace collapsed
+        # if collapse is set; subclasses written against the old API only
+        # override to_html and are rendered as they are
+        if type(self).to_html is not HTMLNode.to_html:
+            return self.to_html()
 
-    def to_html(self):
         raise NotImplementedError()
 
+    def structural_hash(self):
+        # equal for any two subtrees that render to the same html
+        return subtree_hashes(self)[id(self)]
+
+    def start_tag(self):
+        if not self.props:
+            return OPEN_TAGS[self.tag]
+
+        return f"<{self.tag} {self.props_to_html()}>"
+
     def props_to_html(self):
         if not self.props:
             return ""
+
+        # the rendered attributes are kept with a copy of the props they came
+        # from; comparing against that copy catches both a new dict and one
+        # changed in place, and costs far less than rendering again
+        cached = self._props_cache
+        if cached is not None and cached[0] == self.props:
+            return cached[1]
+
         buffer = []
         for k, v in self.props.items():
-            buffer.append(f'{k}="{v}"')
+            buffer.append(f'{k}="{escape_attribute(v)}"')
 
-        return " ".join(buffer)
+        rendered = " ".join(buffer)
+        self._props_cache = (dict(self.props), rendered)
+        return rendered
 
     def __repr__(self):
         buffer = f'HTMLNode (tag=<{self.tag}>\n \t value="{self.value}"'
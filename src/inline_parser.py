@@ -0,0 +1,307 @@
+import re
+from functools import lru_cache
+from string import punctuation
+
+from markdown_extractor import IMAGE_REGEX, LINK_REGEX
+from textnode import TextNode, TextType
+
+
+# images are tried before links so "![alt](src)" is never read as "!" + link.
+# the lookahead lets the regex engine skip to the next candidate character
+# instead of trying every alternative at every position. a backtick without
+# a closing one does not match and stays literal.
+INLINE_TOKEN = re.compile(rf"(?=[!\[*_`])(?:{IMAGE_REGEX}|{LINK_REGEX}|\*+|_+|`([^`]*)`)")
+
+# match.lastindex of each kind of token; emphasis runs have no group
+IMAGE_GROUP = 2
+LINK_GROUP = 4
+CODE_GROUP = 5
+
+PUNCTUATION = frozenset(punctuation)
+
+
+class _Delimiter:
+    # a run of "*" or "_" that may open or close emphasis; index is its
+    # position in the token list
+    __slots__ = ("char", "count", "length", "can_open", "can_close", "index", "prev", "next")
+
+    def __init__(self, char, count, can_open, can_close, index):
+        self.char = char
+        self.count = count
+        self.length = count
+        self.can_open = can_open
+        self.can_close = can_close
+        self.index = index
+        self.prev = None
+        self.next = None
+
+
+def parse_inline(text):
+    if not text:
+        return []
+
+    tokens, delimiters = _tokenize(text)
+
+    if not delimiters:
+        return _collect(tokens)
+
+    # tokens are linked by index so a matched span can be folded into a
+    # single entry without shifting the rest of the list
+    following = list(range(1, len(tokens) + 2))
+    preceding = list(range(-1, len(tokens)))
+    tokens.append("")
+
+    # runs left unmatched keep their remaining characters as literal text,
+    # so one stray delimiter no longer costs the rest of the paragraph
+    process_emphasis(delimiters, tokens, following, preceding)
+
+    return _collect_linked(tokens, following, 0, len(tokens) - 1)
+
+
+def _tokenize(text):
+    # literal text is kept as str, links, images and code spans as finished
+    # TextNodes and emphasis runs as _Delimiter entries
+    tokens = [""]
+    append = tokens.append
+    delimiters = []
+
+    size = len(text)
+    text_start = 0
+
+    for match in INLINE_TOKEN.finditer(text):
+        start, end = match.span()
+        kind = match.lastindex
+
+        if kind is None:
+            char = text[start]
+            can_open, can_close = _flanking(
+                char,
+                text[start - 1] if start else " ",
+                text[end] if end < size else " ",
+            )
+            if not (can_open or can_close):
+                continue
+
+            count = end - start
+            if can_close and start > text_start and count < 3 and delimiters:
+                # the common "**plain text**" case is folded right away: a
+                # closer straight after its opener, with only text between,
+                # is what process_emphasis would match it with anyway. an
+                # opener that can also close may already have been used as a
+                # closer, so that case is left to the full algorithm.
+                opener = delimiters[-1]
+                if (
+                    opener.index == len(tokens) - 1
+                    and opener.char == char
+                    and opener.count == count
+                    and not opener.can_close
+                ):
+                    text_type = TextType.BOLD if count == 2 else TextType.ITALIC
+                    tokens[-1] = TextNode(text[text_start:start], text_type)
+                    delimiters.pop()
+                    if delimiters:
+                        delimiters[-1].next = None
+                    text_start = end
+                    continue
+
+            if start > text_start:
+                append(text[text_start:start])
+
+            delimiter = _Delimiter(char, count, can_open, can_close, len(tokens))
+            if delimiters:
+                delimiter.prev = delimiters[-1]
+                delimiters[-1].next = delimiter
+            delimiters.append(delimiter)
+            append(delimiter)
+            text_start = end
+            continue
+
+        if start > text_start:
+            append(text[text_start:start])
+
+        if kind == CODE_GROUP:
+            code = match.group(CODE_GROUP)
+            if code:
+                append(TextNode(code, TextType.CODE))
+        elif kind == IMAGE_GROUP:
+            append(TextNode(match.group(1), TextType.IMAGE, match.group(2)))
+        else:
+            append(TextNode(match.group(3), TextType.LINK, match.group(4)))
+
+        text_start = end
+
+    if text_start < size:
+        append(text[text_start:])
+
+    return tokens, delimiters
+
+
+@lru_cache(maxsize=4096)
+def _flanking(char, before, after):
+    before_space = before.isspace()
+    after_space = after.isspace()
+    before_punct = before in PUNCTUATION
+    after_punct = after in PUNCTUATION
+
+    left = not after_space and (not after_punct or before_space or before_punct)
+    right = not before_space and (not before_punct or after_space or after_punct)
+
+    if char == "*":
+        return left, right
+
+    # "_" may not open or close inside a word, so snake_case stays literal
+    return left and (not right or before_punct), right and (not left or after_punct)
+
+
+def process_emphasis(delimiters, tokens, following, preceding):
+    # CommonMark's delimiter-stack algorithm. openers_bottom remembers how far
+    # down a failed search already looked for each kind of closer, so no
+    # opener is scanned twice for the same kind and the pass stays linear
+    # even on inputs made of nothing but unmatched delimiters.
+    openers_bottom = {}
+    closer = delimiters[0]
+
+    while closer is not None:
+        if not closer.can_close:
+            closer = closer.next
+            continue
+
+        key = (closer.char, closer.can_open, closer.length % 3)
+        bottom = openers_bottom.get(key)
+        opener = closer.prev
+
+        while opener is not None and opener is not bottom:
+            if opener.char == closer.char and opener.can_open:
+                odd_match = (
+                    (closer.can_open or opener.can_close)
+                    and (opener.length + closer.length) % 3 == 0
+                    and (opener.length % 3 or closer.length % 3)
+                )
+                if not odd_match:
+                    break
+            opener = opener.prev
+        else:
+            opener = None
+
+        if opener is None:
+            openers_bottom[key] = closer.prev
+            after = closer.next
+            if not closer.can_open:
+                _unlink(closer)
+            closer = after
+            continue
+
+        used = 2 if opener.count >= 2 and closer.count >= 2 else 1
+        opener.count -= used
+        closer.count -= used
+
+        text_type = TextType.BOLD if used == 2 else TextType.ITALIC
+        _wrap(tokens, following, preceding, opener.index, closer.index, text_type)
+
+        # delimiters inside the new span can no longer match anything outside it
+        opener.next = closer
+        closer.prev = opener
+
+        if not opener.count:
+            _remove(following, preceding, opener.index)
+            _unlink(opener)
+
+        if not closer.count:
+            _remove(following, preceding, closer.index)
+            after = closer.next
+            _unlink(closer)
+            closer = after
+
+
+def _unlink(delimiter):
+    if delimiter.prev is not None:
+        delimiter.prev.next = delimiter.next
+    if delimiter.next is not None:
+        delimiter.next.prev = delimiter.prev
+
+
+def _remove(following, preceding, index):
+    following[preceding[index]] = following[index]
+    preceding[following[index]] = preceding[index]
+
+
+def _wrap(tokens, following, preceding, opener, closer, text_type):
+    first = following[opener]
+    if first == closer:
+        return
+
+    token = tokens[first]
+    if following[first] == closer and type(token) is str:
+        # the common case of a span around plain text
+        node = TextNode(token, text_type)
+    else:
+        children = _collect_linked(tokens, following, opener, closer)
+
+        if len(children) == 1 and children[0].text_type == TextType.TEXT:
+            node = TextNode(children[0].text, text_type)
+        else:
+            plain = "".join(child.text for child in children)
+            node = TextNode(plain, text_type, None, children)
+
+    # the span takes over the slot of its first token
+    tokens[first] = node
+    following[first] = closer
+    preceding[closer] = first
+
+
+def _collect(tokens):
+    # runs of literal text are gathered in a list and joined once, so a long
+    # run costs linear time rather than one copy per piece
+    result = []
+    append = result.append
+    pending = []
+
+    for token in tokens:
+        if type(token) is str:
+            if token:
+                pending.append(token)
+        else:
+            if pending:
+                append(_text_node(pending))
+                pending.clear()
+            append(token)
+
+    if pending:
+        append(_text_node(pending))
+
+    return result
+
+
+def _collect_linked(tokens, following, index, stop):
+    # finished spans are already TextNodes, so only one level is walked here
+    result = []
+    append = result.append
+    pending = []
+    index = following[index]
+
+    while index != stop:
+        token = tokens[index]
+        token_type = type(token)
+
+        if token_type is str:
+            if token:
+                pending.append(token)
+        elif token_type is _Delimiter:
+            if token.count:
+                pending.append(token.char * token.count)
+        else:
+            if pending:
+                append(_text_node(pending))
+                pending.clear()
+            append(token)
+
+        index = following[index]
+
+    if pending:
+        append(_text_node(pending))
+
+    return result
+
+
+def _text_node(pieces):
+    return TextNode(pieces[0] if len(pieces) == 1 else "".join(pieces), TextType.TEXT)
@@ -1,16 +1,37 @@
-from htmlnode import HTMLNode
+from html_escape import escape_text
+from htmlnode import HTMLNode, OPEN_TAGS, CLOSE_TAGS, PREFORMATTED_TAGS, collapse_whitespace
+
+
+# elements without content or a closing tag
+VOID_TAGS = frozenset(["img", "br", "hr", "input", "meta", "link"])
 
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
 
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props)
 
-    def to_html(self):
-        if not self.value:
+    def to_html(self, cache=None, minify=False):
+        # a single leaf costs less to render than to look up
+        return self._render(minify)
+
+    def _render(self, collapse=False):
+        tag = self.tag
+        if tag in VOID_TAGS:
+            return self.start_tag()
+
+        value = self.value
+        if not value:
             raise ValueError("Leaf Node must have a value")
 
-        if not self.tag:
-            return self.value
+        if collapse and tag not in PREFORMATTED_TAGS:
+            value = collapse_whitespace(value)
+
+        if not tag:
+            return escape_text(value)
+
+        if self.props:
+            return f"<{tag} {self.props_to_html()}>{escape_text(value)}{CLOSE_TAGS[tag]}"
 
-        return f"<{self.tag}{f" {self.props_to_html()}" if self.props else ""}>{self.value}</{self.tag}>"
+        return f"{OPEN_TAGS[tag]}{escape_text(value)}{CLOSE_TAGS[tag]}"
@@ -1,23 +1,39 @@
-# from textnode import TextNode, TextType
-# from htmlnode import HTMLNode
-from leafnode import LeafNode
-from parentnode import ParentNode
-
-
-def main():
-    # text_node = TextNode("This is test text", TextType.LINK, "https://www.bootdev.com")
-
-    node = ParentNode(
-        "div",
-        [
-            LeafNode("b", "Bold text"),
-            LeafNode(None, "Normal text"),
-            LeafNode("i", "italic text"),
-            LeafNode(None, "Normal text"),
-        ],
-    )
+import argparse
+import time
+
+from site_builder import build_site
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="convert a content directory of markdown into html pages")
+    build.add_argument("--content", default="content", help="directory of .md pages (default: content)")
+    build.add_argument("--template", default="template.html", help="page template (default: template.html)")
+    build.add_argument("--dest", default="public", help="output directory (default: public)")
+    build.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    build.add_argument("--force", action="store_true", help="rebuild every page, not only the changed ones")
+    build.add_argument("--explain", action="store_true", help="print why each page was rebuilt or removed")
 
-    print(node.to_html())
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    start = time.perf_counter()
+    report = build_site(args.content, args.template, args.dest, args.jobs, args.force)
+
+    if args.explain:
+        for page in report.built:
+            print(f"{page}: {'; '.join(report.reasons[page])}")
+        for page in report.removed:
+            print(f"{page}: source removed")
+
+    print(
+        f"built {len(report.built)}, skipped {len(report.skipped)}, removed {len(report.removed)} "
+        f"pages in {args.dest} in {time.perf_counter() - start:.2f}s"
+    )
 
 
 if __name__ == "__main__":
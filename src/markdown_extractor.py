@@ -1,18 +1,31 @@
 import re
 
 
-def extract_markdown_images(text):
-    # regex = r"!\[(.*?)\]\((.*?)\)"
+# IMAGE_REGEX = r"!\[(.*?)\]\((.*?)\)"
+IMAGE_REGEX = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
 
-    regex = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    return re.findall(regex, text)
+# LINK_REGEX = r"\[(.*?)\]\((.*?)\)"
+LINK_REGEX = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
 
+IMAGE_PATTERN = re.compile(IMAGE_REGEX)
+LINK_PATTERN = re.compile(LINK_REGEX)
 
-def extract_markdown_links(text):
-    # regex = r"\[(.*?)\]\((.*?)\)"
 
-    regex = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    return re.findall(regex, text)
+def find_markdown_images(text):
+    # match objects keep the span, so callers can slice instead of searching
+    return IMAGE_PATTERN.finditer(text)
+
+
+def find_markdown_links(text):
+    return LINK_PATTERN.finditer(text)
+
+
+def extract_markdown_images(text):
+    return IMAGE_PATTERN.findall(text)
+
+
+def extract_markdown_links(text):
+    return LINK_PATTERN.findall(text)
 
 
 if __name__ == "__main__":
@@ -20,3 +33,4 @@ if __name__ == "__main__":
     text = "This is text with an ![alt text](https://example.com/image.png) and another ![second alt](http://test.com/pic.jpg)"
 
     print(extract_markdown_images(text))
+    print([m.span() for m in find_markdown_images(text)])
@@ -1,9 +1,56 @@
+from functools import lru_cache
+
 from splitnodes import split_nodes_delimiter
 from textnode import TextNode, TextType
 from split_links import split_nodes_link, split_nodes_image
+from inline_parser import parse_inline
+
+
+INLINE_CACHE_SIZE = 4096
 
 
 def text_to_textnodes(text):
+    return parse_inline(text)
+
+
+def text_to_textnodes_batch(texts):
+    # yields one node list per input paragraph, in input order, parsing each
+    # only when it is asked for. this is a convenience over a loop, not a
+    # speedup: parse_inline keeps no state worth sharing between calls, and
+    # a process pool spends about half the parse time just pickling the
+    # paragraphs out and unpickling the nodes back in the calling process
+    yield from map(parse_inline, texts)
+
+
+def _parse_frozen(text):
+    return tuple(node.freeze() for node in parse_inline(text))
+
+
+_cached_parse = lru_cache(maxsize=INLINE_CACHE_SIZE)(_parse_frozen)
+
+
+def cached_text_to_textnodes(text):
+    # the same tuple is handed to every caller asking for this paragraph, so
+    # it holds FrozenTextNodes, which nothing can modify
+    return _cached_parse(text)
+
+
+def set_inline_cache_size(maxsize):
+    # None removes the bound, 0 disables caching
+    global _cached_parse
+    _cached_parse = lru_cache(maxsize=maxsize)(_parse_frozen)
+
+
+def inline_cache_info():
+    return _cached_parse.cache_info()
+
+
+def clear_inline_cache():
+    _cached_parse.cache_clear()
+
+
+def text_to_textnodes_multipass(text):
+    # the original six-pass pipeline, kept for comparison in bench/
     if not text:
         return []
 
@@ -1,23 +1,140 @@
-def clean_line(line):
-    line = line.strip()
-    line = line.strip("\n")
+from collections import namedtuple
 
-    return line
+from block_parser import classify_lines
+
+
+# a block is md[start:end]; line is the 1-based line it starts on
+BlockSpan = namedtuple("BlockSpan", ["start", "end", "line"])
+
+
+def markdown_block_index(md):
+    # one pass over the text: blocks are separated by "\n\n" and trimmed
+    # of surrounding whitespace by moving the offsets, never by copying
+    index = []
+    size = len(md)
+    pos = 0
+    line = 1
+    counted = 0
+
+    while pos <= size:
+        stop = _block_end(md, pos, size)
+
+        start, end = pos, stop
+        while start < end and md[start].isspace():
+            start += 1
+        while end > start and md[end - 1].isspace():
+            end -= 1
+
+        if start < end:
+            line += md.count("\n", counted, start)
+            counted = start
+            index.append(BlockSpan(start, end, line))
+
+        pos = stop + 2
+
+    return index
+
+
+def _block_end(md, pos, size):
+    # the "\n\n" ending the block that starts at pos; blank lines inside a
+    # fenced code block do not count, so the fence comes out as one block
+    in_fence = False
+
+    while True:
+        stop = md.find("\n\n", pos)
+        if stop == -1:
+            return size
+
+        if md.find("```", pos, stop) != -1:
+            for line in md[pos:stop].split("\n"):
+                in_fence = fence_state(line, in_fence)
+
+        if not in_fence:
+            return stop
+
+        pos = stop + 2
+
+
+def fence_state(line, in_fence):
+    # whether a fenced code block is open after this line
+    stripped = line.strip()
+    if in_fence:
+        # "code```" closes the fence too, as classify_lines accepts it
+        return not (stripped.startswith("```") or stripped.endswith("```"))
+
+    if not stripped.startswith("```"):
+        return False
+
+    info = stripped.lstrip("`")
+    if not info:
+        # a bare "``````" is a complete one-line code block
+        return len(stripped) < 6
+
+    # "```code```" opens and closes on the same line
+    return "`" not in info
 
 
 def markdown_to_blocks(md):
-    md = md.strip("\n")
+    return [md[start:end] for start, end, _ in markdown_block_index(md)]
+
+
+def iter_markdown_blocks(lines):
+    # accepts a file object or any iterable of lines and yields each block
+    # once the blank line after it is seen, so only one block is in memory
+    for group in _iter_line_groups(lines):
+        yield "\n".join(group)
+
+
+def scan_blocks(lines):
+    # like iter_markdown_blocks, but yields the BlockInfo of every block so
+    # the lines are split and classified exactly once
+    for group in _iter_line_groups(lines):
+        yield classify_lines(group)
+
+
+def _iter_line_groups(lines):
+    group = []
+    in_fence = False
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        if line or in_fence:
+            group.append(line)
+            if "```" in line:
+                in_fence = fence_state(line, in_fence)
+            continue
+
+        if group:
+            group = _trim_lines(group)
+            if group:
+                yield group
+            group = []
+
+    if group:
+        group = _trim_lines(group)
+        if group:
+            yield group
 
-    array = md.split("\n\n")
 
-    array = list(map(clean_line, array))
+def _trim_lines(group):
+    # strips the block's lines as if they were joined and stripped as one
+    # string: blank lines are dropped from both ends, then the leading
+    # whitespace of the first line and the trailing of the last
+    first = 0
+    last = len(group)
+    while first < last and not group[first].strip():
+        first += 1
+    while last > first and not group[last - 1].strip():
+        last -= 1
 
-    for i in range(len(array)):
-        if array[i] == "":
-            array.pop(i)
+    if first == last:
+        return []
 
-    # print(array)
-    return array
+    group = group[first:last]
+    group[0] = group[0].lstrip()
+    group[-1] = group[-1].rstrip()
+    return group
 
 
 if __name__ == "__main__":
@@ -1,22 +1,47 @@
-from htmlnode import HTMLNode
+from htmlnode import HTMLNode, CLOSE_TAGS, PREFORMATTED_TAGS, strip_block_whitespace
 
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
 
-    def to_html(self):
+    def _fragments(self, minify=False):
+        # walks the subtree with an explicit stack instead of recursing, so
+        # nesting depth is not bounded by the interpreter's recursion limit.
+        # collapse is decided once per parent: whitespace is kept anywhere
+        # below a preformatted tag.
+        yield self._open_tag()
+        collapse = minify and self.tag not in PREFORMATTED_TAGS
+        stack = [(self, iter(self.kept_children(collapse)), collapse)]
+
+        while stack:
+            node, children, collapse = stack[-1]
+
+            for child in children:
+                if isinstance(child, ParentNode):
+                    yield child._open_tag()
+                    child_collapse = collapse and child.tag not in PREFORMATTED_TAGS
+                    stack.append((child, iter(child.kept_children(child_collapse)), child_collapse))
+                    break
+
+                yield child._render(collapse)
+            else:
+                stack.pop()
+                yield CLOSE_TAGS[node.tag]
+
+    def kept_children(self, collapse):
+        if not collapse:
+            return self.children
+
+        return strip_block_whitespace(self.children)
+
+    def _open_tag(self):
         if not self.tag:
             raise ValueError("Parent node must have a tag")
 
         if not self.children:
             raise ValueError("Parent node must have children nodes")
 
-        buffer = f"<{self.tag}{f" {self.props_to_html()}" if self.props else ""}>"
-
-        for child in self.children:
-            buffer += child.to_html()
-
-        buffer += f"</{self.tag}>"
-
-        return buffer
+        return self.start_tag()
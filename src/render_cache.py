@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from operator import attrgetter
+
+from htmlnode import CLOSE_TAGS, PREFORMATTED_TAGS
+from parentnode import ParentNode
+
+
+RENDER_CACHE_SIZE = 16384
+
+# a parent with less text than this renders about as fast as its key is
+# built and looked up, so it is rendered every time instead
+CACHED_TEXT_LENGTH = 256
+
+_LEAF = attrgetter("__class__", "tag", "value")
+_VALUE = attrgetter("value")
+_PROPS = attrgetter("props")
+_CHILDREN = attrgetter("children")
+
+
+class RenderCache:
+    # rendered html of the parents whose children are all leaves holding at
+    # least min_length characters of text (the longer paragraphs and list
+    # items of a page), so rendering a tree again, or a rebuilt copy of it,
+    # only renders those that changed. everything else is rendered every
+    # time; the parents above cached ones cost little more than their tags,
+    # and no fragment holds another, so memory stays linear in the size of
+    # the html however deep the tree is.
+    #
+    # a fragment is keyed by a flat tuple of the parent's type and tag and of
+    # each child's type, tag and value, and stored with a copy of the props
+    # of the parent and of every child, which must compare equal as well.
+    # the dict compares keys on a hash collision, so a colliding parent is
+    # never handed another's html, and since no key holds another key the
+    # comparison never recurses. the least recently used fragment is dropped
+    # once maxsize is hit. a parent renders differently with whitespace
+    # collapsed, so whether it was is part of the key.
+    def __init__(self, maxsize=RENDER_CACHE_SIZE, min_length=CACHED_TEXT_LENGTH):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.min_length = min_length
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def clear(self):
+        self._fragments.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, root, minify=False):
+        collapse = minify and root.tag not in PREFORMATTED_TAGS
+        if not isinstance(root, ParentNode):
+            return root._render(collapse)
+
+        html = self._fragment(root, collapse)
+        if html is not None:
+            return html
+
+        # like ParentNode._fragments, with cached parents looked up instead
+        # of walked
+        out = [root._open_tag()]
+        stack = [(root, iter(root.kept_children(collapse)), collapse)]
+
+        while stack:
+            node, children, collapse = stack[-1]
+
+            for child in children:
+                if not isinstance(child, ParentNode):
+                    out.append(child._render(collapse))
+                    continue
+
+                child_collapse = collapse and child.tag not in PREFORMATTED_TAGS
+                html = self._fragment(child, child_collapse)
+                if html is None:
+                    out.append(child._open_tag())
+                    stack.append((child, iter(child.kept_children(child_collapse)), child_collapse))
+                    break
+
+                out.append(html)
+            else:
+                stack.pop()
+                out.append(CLOSE_TAGS[node.tag])
+
+        return "".join(out)
+
+    def _fragment(self, node, collapse):
+        # the html of node, or None if it is not one the cache keeps. the
+        # children are read by map, so a lookup costs no python-level work
+        # per child. a missing or empty children list is left to _open_tag,
+        # which raises.
+        children = node.children
+        if not children or sum(map(len, filter(None, map(_VALUE, children)))) < self.min_length:
+            return None
+        if any(map(_CHILDREN, children)):
+            return None
+
+        key = (collapse, type(node), node.tag, tuple(map(_LEAF, children)))
+        props = (node.props, tuple(map(_PROPS, children)))
+
+        cached = self._fragments.get(key)
+        if cached is not None and cached[0] == props:
+            self.hits += 1
+            self._fragments.move_to_end(key)
+            return cached[1]
+
+        self.misses += 1
+        html = "".join(node._fragments(collapse))
+
+        # props are stored as copies, so a dict changed in place no longer
+        # compares equal to its old self
+        props = (_copy_props(node.props), tuple(map(_copy_props, props[1])))
+        self._fragments[key] = (props, html)
+        self._fragments.move_to_end(key)
+        if len(self._fragments) > self.maxsize:
+            self._fragments.popitem(last=False)
+        return html
+
+
+def _copy_props(props):
+    return dict(props) if props else None
@@ -0,0 +1,299 @@
+import json
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from block_to_html import lines_to_html_nodes
+from html_escape import escape_text
+from leafnode import LeafNode
+from md_to_block import fence_state
+from parentnode import ParentNode
+from templates import CompiledTemplate, compile_template, content_hash
+
+
+# fewest pages built with a process pool. starting and stopping one took
+# 8 ms with 2 workers and 11-15 ms with 4, while a two-section page takes
+# about 0.5 ms to build, so the pool only pays for itself from around 33
+# pages, before counting what is pickled to the workers
+PAGE_POOL_THRESHOLD = 32
+
+# kept in the output directory; records what every page was built from
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 2
+
+# a line "{{ list: blog }}" becomes a list of links to the pages in
+# content/blog; inside fenced code it is left as it is
+LIST_DIRECTIVE = re.compile(r"\{\{ list: *([^}\n]*?) *\}\}")
+
+# destination paths of the pages written, left alone and deleted by a build;
+# reasons maps every written page to why it had to be written
+BuildReport = namedtuple("BuildReport", ["built", "skipped", "removed", "reasons"])
+
+
+def extract_title(md):
+    for line in md.split("\n"):
+        if line.startswith("# "):
+            return line[2:].strip()
+
+    raise ValueError("Page must have a h1 header")
+
+
+def listed_directories(md):
+    return sorted({_directory_key(name) for _, name in _list_directives(md.split("\n"))})
+
+
+def _list_directives(lines):
+    # (line number, directory) of every list directive outside fenced code
+    in_fence = False
+    for number, line in enumerate(lines):
+        if not in_fence:
+            match = LIST_DIRECTIVE.fullmatch(line)
+            if match:
+                yield number, match.group(1)
+        if "```" in line:
+            in_fence = fence_state(line, in_fence)
+
+
+def _directory_key(name):
+    # the content directory a list directive names, spelled like the
+    # directory part of a page key; the top level is ""
+    name = os.path.normpath(name.strip("/"))
+    return "" if name == os.curdir else name
+
+
+def render_page(md, template, listings=None):
+    # template is a CompiledTemplate or the text of one; listings maps each
+    # listed directory to the (title, url) of its pages
+    if isinstance(template, str):
+        template = CompiledTemplate(template)
+
+    # the text between directives is converted on its own, and each listing
+    # is built from nodes, so a title is never read as markdown
+    lines = md.split("\n")
+    children = []
+    start = 0
+    if listings:
+        for number, name in _list_directives(lines):
+            children.extend(lines_to_html_nodes(lines[start:number]))
+            entries = listings[_directory_key(name)]
+            if entries:
+                children.append(_listing_node(entries))
+            start = number + 1
+    children.extend(lines_to_html_nodes(lines[start:]))
+
+    # the title is raw markdown text, while the content is already html
+    content = ParentNode("div", children or [LeafNode(None, "\n")]).to_html()
+    return template.render({"Title": escape_text(extract_title(md)), "Content": content})
+
+
+def _listing_node(entries):
+    return ParentNode("ul", [ParentNode("li", [LeafNode("a", title, {"href": url})]) for title, url in entries])
+
+
+def generate_page(src_path, template, dest_path, listings=None):
+    with open(src_path, encoding="utf-8") as f:
+        md = f.read()
+
+    html = render_page(md, template, listings)
+
+    os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+    with open(dest_path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    return dest_path
+
+
+def find_pages(content_dir, dest_dir):
+    # (source, destination) for every .md file below content_dir, with the
+    # directory layout kept and the extension changed to .html
+    return [
+        (os.path.join(content_dir, relative), os.path.join(dest_dir, output))
+        for relative, output in _find_sources(content_dir)
+    ]
+
+
+def _find_sources(content_dir):
+    # (source, output) paths relative to their directories
+    sources = []
+
+    for root, dirs, files in os.walk(content_dir):
+        dirs.sort()
+        prefix = os.path.relpath(root, content_dir)
+        prefix = "" if prefix == os.curdir else prefix + os.sep
+
+        for name in sorted(files):
+            if name.endswith(".md"):
+                sources.append((prefix + name, prefix + name[:-3] + ".html"))
+
+    return sources
+
+
+def build_site(content_dir, template_path, dest_dir, jobs=None, force=False):
+    # a page is generated again only when something it depends on changed:
+    # its source, the template or a partial the template includes, or the
+    # titles of the pages it lists. force rebuilds every page, but the old
+    # manifest is still read so the outputs of deleted sources are removed.
+    template, dependencies = compile_template(template_path)
+
+    manifest = load_manifest(dest_dir)
+    previous = manifest.get("pages", {})
+    old_dependencies = manifest.get("templates", {})
+    changed_templates = [path for path, digest in dependencies.items() if old_dependencies.get(path) != digest]
+
+    records = {}
+    for key, output in _find_sources(content_dir):
+        records[key] = _page_record(content_dir, key, output, previous.get(key))
+
+    # every page's title is known now, which is what listings depend on
+    directories = {}
+    for key, record in records.items():
+        directories.setdefault(os.path.dirname(key), []).append([key, record["title"]])
+
+    stale = []
+    skipped = []
+    reasons = {}
+
+    for key, record in records.items():
+        record["listed"] = {
+            directory: [entry for entry in directories.get(directory, []) if entry[0] != key]
+            for directory in record["lists"]
+        }
+
+        dest_path = os.path.join(dest_dir, record["output"])
+        if force:
+            why = ["forced"]
+        else:
+            why = _rebuild_reasons(record, previous.get(key), changed_templates, dest_path)
+
+        if not why:
+            skipped.append(dest_path)
+            continue
+
+        reasons[dest_path] = why
+        listings = None
+        if record["listed"]:
+            listings = {
+                directory: [(title, "/" + records[page]["output"].replace(os.sep, "/")) for page, title in entries]
+                for directory, entries in record["listed"].items()
+            }
+        stale.append((os.path.join(content_dir, key), dest_path, listings))
+
+    removed = []
+    for key, old in previous.items():
+        if key in records:
+            continue
+
+        dest_path = os.path.join(dest_dir, old["output"])
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        removed.append(dest_path)
+
+    built = generate_pages(stale, template, jobs)
+
+    # written last, so a build that fails part way is redone next time
+    if built or removed or changed_templates or records != previous:
+        save_manifest(dest_dir, {"version": MANIFEST_VERSION, "templates": dependencies, "pages": records})
+
+    return BuildReport(built, skipped, removed, reasons)
+
+
+def _page_record(content_dir, key, output, old):
+    src_path = os.path.join(content_dir, key)
+    stat = os.stat(src_path)
+    record = {"hash": None, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "output": output}
+
+    # an unchanged mtime and size is taken as an unchanged file, so a build
+    # with nothing to do never reads the sources
+    if old is not None and old["mtime_ns"] == record["mtime_ns"] and old["size"] == record["size"]:
+        record.update(hash=old["hash"], title=old["title"], lists=old["lists"])
+        return record
+
+    with open(src_path, "rb") as f:
+        data = f.read()
+    record["hash"] = content_hash(data)
+
+    if old is not None and record["hash"] == old["hash"]:
+        record.update(title=old["title"], lists=old["lists"])
+        return record
+
+    md = data.decode("utf-8")
+    record.update(title=extract_title(md), lists=listed_directories(md))
+    return record
+
+
+def _rebuild_reasons(record, old, changed_templates, dest_path):
+    if old is None:
+        return ["new page"]
+
+    reasons = []
+    if record["hash"] != old["hash"]:
+        reasons.append("source changed")
+
+    for path in changed_templates:
+        reasons.append(f"{path} changed")
+
+    old_listed = old.get("listed", {})
+    for directory, entries in record["listed"].items():
+        if entries == old_listed.get(directory):
+            continue
+
+        before = dict(old_listed.get(directory, []))
+        after = dict(entries)
+        for page in sorted(before.keys() | after.keys()):
+            if page not in before:
+                reasons.append(f"listed page {page} added")
+            elif page not in after:
+                reasons.append(f"listed page {page} removed")
+            elif before[page] != after[page]:
+                reasons.append(f"listed page {page} retitled")
+
+    if not reasons and not os.path.exists(dest_path):
+        reasons.append("output missing")
+
+    return reasons
+
+
+def generate_pages(pages, template, jobs=None):
+    # pages is a list of (source, destination, listings); returns the
+    # destinations
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(pages) <= PAGE_POOL_THRESHOLD:
+        return [generate_page(src, template, dest, listings) for src, dest, listings in pages]
+
+    sources, destinations, listings = zip(*pages)
+
+    # the template travels with every chunk of pages, not with every page
+    chunksize = max(1, len(pages) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(
+            pool.map(generate_page, sources, repeat(template), destinations, listings, chunksize=chunksize)
+        )
+
+
+def load_manifest(dest_dir):
+    # a missing, unreadable or outdated manifest means nothing is known
+    try:
+        with open(os.path.join(dest_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+
+    return manifest
+
+
+def save_manifest(dest_dir, manifest):
+    os.makedirs(dest_dir, exist_ok=True)
+    path = os.path.join(dest_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+
+    # dumps runs the C encoder, dump would encode in Python piece by piece
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(manifest))
+    os.replace(tmp_path, path)
@@ -1,8 +1,8 @@
-from markdown_extractor import extract_markdown_images, extract_markdown_links
+from markdown_extractor import find_markdown_images, find_markdown_links
 from textnode import TextNode, TextType
 
 
-def preprocess(old_nodes, ttype, extractor):
+def preprocess(old_nodes, ttype, finder):
     result = []
 
     for node in old_nodes:
@@ -11,35 +11,29 @@ def preprocess(old_nodes, ttype, extractor):
             continue
 
         text = node.text
+        text_start = 0
 
-        data = extractor(text)
-        if not data:
-            result.append(node)
-            continue
-
-        for extra, url in data:
-            markdown_syntax = f"[{extra}]({url})"
+        for match in finder(text):
+            start, end = match.span()
+            extra, url = match.groups()
 
-            if ttype == TextType.IMAGE:
-                markdown_syntax = "!" + markdown_syntax
-
-            splits = text.split(markdown_syntax, 1)
-
-            if splits[0]:
-                result.append(TextNode(splits[0], TextType.TEXT))
+            if start > text_start:
+                result.append(TextNode(text[text_start:start], TextType.TEXT))
 
             result.append(TextNode(extra, ttype, url))
-            text = splits[1]
+            text_start = end
 
-        if text:
-            result.append(TextNode(text, TextType.TEXT))
+        if text_start == 0:
+            result.append(node)
+        elif text_start < len(text):
+            result.append(TextNode(text[text_start:], TextType.TEXT))
 
     return result
 
 
 def split_nodes_link(old_nodes):
-    return preprocess(old_nodes, TextType.LINK, extract_markdown_links)
+    return preprocess(old_nodes, TextType.LINK, find_markdown_links)
 
 
 def split_nodes_image(old_nodes):
-    return preprocess(old_nodes, TextType.IMAGE, extract_markdown_images)
+    return preprocess(old_nodes, TextType.IMAGE, find_markdown_images)
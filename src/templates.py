@@ -0,0 +1,103 @@
+import os
+import re
+from hashlib import blake2b
+
+
+# {{> name }} is replaced by partials/name.html from the template's directory
+PARTIAL_PATTERN = re.compile(r"\{\{>\s*([\w./-]+)\s*\}\}")
+PARTIALS_DIR = "partials"
+
+# {{ Name }} is filled in for every page
+SLOT_PATTERN = re.compile(r"\{\{ *(\w+) *\}\}")
+
+# path -> (mtime and size of every file it was built from, template, dependencies)
+_compiled_templates = {}
+
+
+class CompiledTemplate:
+    # the template split once into literal text and slots; parts holds both,
+    # with each slot's placeholder text at the positions listed in slots
+    __slots__ = ("parts", "slots")
+
+    def __init__(self, text):
+        self.parts = []
+        self.slots = {}
+        pos = 0
+
+        for match in SLOT_PATTERN.finditer(text):
+            if match.start() > pos:
+                self.parts.append(text[pos : match.start()])
+            self.slots.setdefault(match.group(1), []).append(len(self.parts))
+            self.parts.append(match.group(0))
+            pos = match.end()
+
+        if pos < len(text):
+            self.parts.append(text[pos:])
+
+    def render(self, values):
+        # slots without a value keep their placeholder, as str.replace would
+        parts = self.parts.copy()
+        for name, positions in self.slots.items():
+            value = values.get(name)
+            if value is not None:
+                for position in positions:
+                    parts[position] = value
+
+        return "".join(parts)
+
+
+def content_hash(data):
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def compile_template(template_path):
+    # load_template, with the result compiled and kept until the template or
+    # one of its partials is modified
+    cached = _compiled_templates.get(template_path)
+    if cached is not None:
+        stamps, template, dependencies = cached
+        if _file_stamps(dependencies) == stamps:
+            return template, dependencies
+
+    text, dependencies = load_template(template_path)
+    template = CompiledTemplate(text)
+    _compiled_templates[template_path] = (_file_stamps(dependencies), template, dependencies)
+    return template, dependencies
+
+
+def _file_stamps(paths):
+    # the size is compared too, since mtimes can be coarser than the edits
+    try:
+        return tuple((stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, paths))
+    except OSError:
+        return None
+
+
+def load_template(template_path):
+    # returns the template with every partial filled in, and the hash of
+    # every file that went into it keyed by path: the template first, then
+    # the partials in the order they were included
+    partials_dir = os.path.join(os.path.dirname(template_path), PARTIALS_DIR)
+    dependencies = {}
+    text = _expand(template_path, partials_dir, dependencies, ())
+    return text, dependencies
+
+
+def _expand(path, partials_dir, dependencies, including):
+    if path in including:
+        raise ValueError(f"Partial includes itself: {path}")
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    dependencies[path] = content_hash(text.encode("utf-8"))
+
+    including += (path,)
+
+    def include(match):
+        partial_path = os.path.join(partials_dir, match.group(1) + ".html")
+        if not os.path.isfile(partial_path):
+            raise ValueError(f"Unknown partial: {match.group(1)}")
+
+        return _expand(partial_path, partials_dir, dependencies, including)
+
+    return PARTIAL_PATTERN.sub(include, text)
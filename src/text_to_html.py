@@ -1,8 +1,20 @@
+from html_escape import escape_attribute, escape_text
 from leafnode import LeafNode
+from parentnode import ParentNode
 from textnode import TextType, TextNode
 
 
 def text_to_html(text_node):
+    if text_node.children:
+        if text_node.text_type == TextType.BOLD:
+            tag = "b"
+        elif text_node.text_type == TextType.ITALIC:
+            tag = "i"
+        else:
+            raise ValueError("Only bold and italic nodes can have children")
+
+        return ParentNode(tag, [text_to_html(child) for child in text_node.children])
+
     if text_node.text_type == TextType.TEXT:
         return LeafNode(None, text_node.text)
 
@@ -31,3 +43,71 @@ def text_to_html(text_node):
 
     else:
         raise ValueError("Unknown text type")
+
+
+# open and close strings of the spans that wrap their text
+SPAN_TAGS = {
+    TextType.TEXT: ("", ""),
+    TextType.BOLD: ("<b>", "</b>"),
+    TextType.ITALIC: ("<i>", "</i>"),
+    TextType.CODE: ("<code>", "</code>"),
+}
+
+
+def _link_html(text_node):
+    if not text_node.url or text_node.url.isspace():
+        raise ValueError("Link node must have a URL")
+
+    return f'<a href="{escape_attribute(text_node.url)}">{escape_text(text_node.text)}</a>'
+
+
+def _image_html(text_node):
+    if not text_node.url or text_node.url.isspace():
+        raise ValueError("Image node must have a URL")
+
+    return f'<img src="{escape_attribute(text_node.url)}" alt="{escape_attribute(text_node.text)}">'
+
+
+ATTRIBUTE_RENDERERS = {
+    TextType.LINK: _link_html,
+    TextType.IMAGE: _image_html,
+}
+
+
+def textnodes_to_html(text_nodes):
+    buffer = []
+    render_textnodes_into(text_nodes, buffer)
+    return "".join(buffer)
+
+
+def render_textnodes_into(text_nodes, buffer):
+    # writes html straight from TextNodes, without building a LeafNode per
+    # span; nested spans are walked with a stack like ParentNode does
+    append = buffer.append
+    stack = [(iter(text_nodes), "")]
+
+    while stack:
+        nodes, close = stack[-1]
+
+        for node in nodes:
+            tags = SPAN_TAGS.get(node.text_type)
+
+            if tags is None:
+                renderer = ATTRIBUTE_RENDERERS.get(node.text_type)
+                if renderer is None:
+                    raise ValueError("Unknown text type")
+                append(renderer(node))
+                continue
+
+            if node.children:
+                if node.text_type is not TextType.BOLD and node.text_type is not TextType.ITALIC:
+                    raise ValueError("Only bold and italic nodes can have children")
+                append(tags[0])
+                stack.append((iter(node.children), tags[1]))
+                break
+
+            append(tags[0] + escape_text(node.text) + tags[1])
+        else:
+            stack.pop()
+            if close:
+                append(close)
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from enum import Enum
 
 
@@ -10,18 +11,46 @@ class TextType(Enum):
     IMAGE = "embedded_image"
 
 
+# an immutable TextNode, for nodes that are shared between callers; children
+# is a tuple of FrozenTextNodes or None
+FrozenTextNode = namedtuple("FrozenTextNode", ["text", "text_type", "url", "children"])
+
+
 class TextNode:
-    def __init__(self, text, t_type, link=None):
+    # children holds nested spans, e.g. the italic inside **bold _italic_**;
+    # text is then the plain text of the whole span
+    __slots__ = ("text", "text_type", "url", "children")
+
+    def __init__(self, text, t_type, link=None, children=None):
         self.text = text
         self.text_type = t_type
         self.url = link
+        self.children = children
+
+    def freeze(self):
+        children = self.children
+        if children is not None:
+            children = tuple(child.freeze() for child in children)
+        return FrozenTextNode(self.text, self.text_type, self.url, children)
 
     def __eq__(self, other):
+        # children may be a list here and a tuple in a FrozenTextNode, so
+        # they are compared item by item
+        children = self.children
+        other_children = other.children
+        if children is not None and other_children is not None:
+            children = list(children)
+            other_children = list(other_children)
+
         return (
             (self.text == other.text)
             and (self.text_type == other.text_type)
             and (self.url == other.url)
+            and (children == other_children)
         )
 
     def __repr__(self):
+        if self.children:
+            return f"TextNode({self.text}, {self.text_type.value}, {self.url}, {self.children})"
+
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"